@@ -206,8 +206,13 @@ class AnalyticsTracker:
         clips = self.fetch_metrics(platform='youtube', hours=24 * 7)  # Last 7 days
         updated_count = 0
 
+        # One API call per 50 videos instead of one per video
+        stats_by_id = self.youtube_publisher.get_video_stats_batch(
+            [clip['video_id'] for clip in clips]
+        )
+
         for clip in clips:
-            metrics = self.youtube_publisher.get_video_stats(clip['video_id'])
+            metrics = stats_by_id.get(clip['video_id'])
 
             if metrics:
                 success = self.update_metrics('youtube', clip['video_id'], metrics)
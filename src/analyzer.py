@@ -6,7 +6,7 @@ Analyzes transcription for exciting, funny, or engaging content.
 
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import json
 
 try:
@@ -16,9 +16,25 @@ except ImportError:
     GEMINI_AVAILABLE = False
     logging.warning("Google Generative AI not available")
 
+# msgspec decodes and validates Gemini responses in one pass; json is the fallback
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Gemini model used for moment detection
+GEMINI_MODEL = 'gemini-pro'
+
+# Bump when the model, prompt or scoring changes so stored moments are recomputed
+DETECTOR_VERSION = 'gemini-pro-2'
+
+# 30-second chunks sent per Gemini request (about 10 minutes of transcript)
+CHUNKS_PER_REQUEST = 20
+
 # Default virality scoring weights
 DEFAULT_WEIGHTS = {
     'audio_excitement': 0.25,
@@ -28,9 +44,67 @@ DEFAULT_WEIGHTS = {
     'trend_alignment': 0.10
 }
 
+if MSGSPEC_AVAILABLE:
+    class _GeminiMoment(msgspec.Struct):
+        """One moment in a Gemini detection response."""
+        start: float
+        end: float
+        type: str = 'exciting'
+        description: str = ''
+        quote: str = ''
+
+    class _GeminiMoments(msgspec.Struct):
+        """Top-level Gemini detection response."""
+        moments: List[_GeminiMoment] = []
+
+    _MOMENTS_DECODER = msgspec.json.Decoder(_GeminiMoments)
+
+def _parse_moments_response(response_text: str) -> List[Dict[str, Any]]:
+    """
+    Parse a Gemini moments response into moment dictionaries.
+
+    Moments without numeric start/end times are dropped rather than
+    failing the whole response.
+
+    Args:
+        response_text: JSON text with a top-level "moments" list
+
+    Returns:
+        Moments with start, end, type, description and quote
+
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON
+    """
+    if MSGSPEC_AVAILABLE:
+        try:
+            return [msgspec.structs.asdict(m) for m in _MOMENTS_DECODER.decode(response_text).moments]
+        except msgspec.DecodeError:
+            pass  # Malformed entries (or invalid JSON): use the lenient path below
+
+    result = json.loads(response_text)
+    moments = result.get('moments', []) if isinstance(result, dict) else []
+
+    parsed = []
+    for moment in moments:
+        try:
+            parsed.append({
+                'start': float(moment['start']),
+                'end': float(moment['end']),
+                'type': str(moment.get('type', 'exciting')),
+                'description': str(moment.get('description', '')),
+                'quote': str(moment.get('quote', ''))
+            })
+        except (KeyError, TypeError, ValueError, AttributeError):
+            logger.warning(f"Dropped malformed moment: {moment}")
+    return parsed
+
 class ViralMomentDetector:
     """Detect viral moments in gaming videos using Gemini AI."""
 
+    # Key for stored moments; the model is included so a model change
+    # never serves moments computed by another one
+    version = f"{DETECTOR_VERSION}/{GEMINI_MODEL}"
+
     def __init__(self, api_key: Optional[str] = None):
         """Initialize detector with Gemini API key."""
         if not GEMINI_AVAILABLE:
@@ -41,31 +115,55 @@ class ViralMomentDetector:
             raise ValueError("GEMINI_API_KEY not provided")
 
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-pro')
+        self.model = genai.GenerativeModel(GEMINI_MODEL)
         logger.info("Initialized Gemini Pro model")
 
     def analyze_transcript(self, transcription: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Analyze transcription for viral moments."""
+        return self.detect_moments(transcription)[0]
+
+    def detect_moments(self, transcription: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Analyze transcription for viral moments, reporting whether every
+        Gemini request succeeded.
+
+        Args:
+            transcription: Transcription dict with segments
+
+        Returns:
+            (scored moments best first, True if no request failed); results
+            with a failed request are incomplete and must not be stored
+        """
         segments = transcription.get('segments', [])
 
         if not segments:
             logger.warning("No segments found in transcription")
-            return []
+            return [], True
 
-        # Group segments into chunks for analysis
+        # Group segments into chunks and send many chunks per request
         chunks = self._create_analysis_chunks(segments)
 
         viral_moments = []
-        for chunk in chunks:
-            moments = self._detect_viral_moments(chunk)
-            viral_moments.extend(moments)
+        failed_batches = 0
+        for i in range(0, len(chunks), CHUNKS_PER_REQUEST):
+            batch_moments = self._detect_viral_moments(chunks[i:i + CHUNKS_PER_REQUEST])
+            if batch_moments is None:
+                failed_batches += 1
+            else:
+                viral_moments.extend(batch_moments)
 
         # Score and rank moments
         scored_moments = [self._score_moment(m) for m in viral_moments]
         scored_moments.sort(key=lambda x: x['virality_score'], reverse=True)
 
         logger.info(f"Detected {len(scored_moments)} potential viral moments")
-        return scored_moments
+
+        # A failed request loses that batch's moments
+        complete = failed_batches == 0
+        if not complete:
+            logger.warning(f"{failed_batches} Gemini request(s) failed; moments are incomplete")
+
+        return scored_moments, complete
 
     def _create_analysis_chunks(self, segments: List[Dict], chunk_duration: int = 30) -> List[List[Dict]]:
         """Create time-based chunks of segments for analysis."""
@@ -89,16 +187,21 @@ class ViralMomentDetector:
 
         return chunks
 
-    def _detect_viral_moments(self, chunk: List[Dict]) -> List[Dict[str, Any]]:
-        """Use Gemini to detect viral moments in a chunk."""
-        # Prepare text from chunk
-        text = '\n'.join([
-            f"[{seg['start']:.1f}s] {seg['text']}"
-            for seg in chunk
-        ])
+    def _detect_viral_moments(self, chunks: List[List[Dict]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Use Gemini to detect viral moments in several chunks with one request.
+
+        Returns:
+            Moments within the chunks, or None if the request or its parsing failed
+        """
+        # Prepare text from chunks, numbered so limits apply per segment
+        text = '\n\n'.join(
+            f"Segment {n}:\n" + '\n'.join(f"[{seg['start']:.1f}s] {seg['text']}" for seg in chunk)
+            for n, chunk in enumerate(chunks, 1)
+        )
 
         # Build prompt
-        prompt = f"""Analyze this transcript segment from a gaming video and identify the most viral moments.
+        prompt = f"""Analyze these transcript segments from a gaming video and identify the most viral moments.
 
 Format: Timestamp in seconds | Type (funny/exciting/shocking/emotional) | Description | Quote (exact words)
 Quote must be EXACT from the transcript. Use 10-15 words maximum.
@@ -107,10 +210,10 @@ Rules:
 - Select 1-3 best moments maximum per segment
 - Must be under 30 seconds for short-form content
 - Quote must be verbatim from the transcript below
-- Timestamps must be within the provided range
+- Timestamps must be within the range of a single segment
 - Include start and end timestamps separately
 
-Transcript segment:
+Transcript segments:
 {text}
 
 Return ONLY valid JSON in this exact format (no markdown, no explanation):
@@ -140,17 +243,16 @@ Return ONLY valid JSON in this exact format (no markdown, no explanation):
 
             # Parse JSON response
             try:
-                result = json.loads(response_text)
-                moments = result.get('moments', [])
+                moments = _parse_moments_response(response_text)
 
-                # Validate moments are within chunk bounds
-                chunk_start = chunk[0]['start']
-                chunk_end = chunk[-1]['end']
+                # Validate each moment lies within one chunk's bounds
+                bounds = [(chunk[0]['start'], chunk[-1]['end']) for chunk in chunks]
 
                 valid_moments = []
                 for moment in moments:
-                    if (chunk_start <= moment['start'] <= chunk_end and
-                        chunk_start <= moment['end'] <= chunk_end):
+                    if any(chunk_start <= moment['start'] <= chunk_end and
+                           chunk_start <= moment['end'] <= chunk_end
+                           for chunk_start, chunk_end in bounds):
                         valid_moments.append(moment)
                     else:
                         logger.warning(f"Filtered out moment outside chunk bounds: {moment}")
@@ -160,11 +262,11 @@ Return ONLY valid JSON in this exact format (no markdown, no explanation):
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse Gemini response: {e}")
                 logger.debug(f"Response text: {response_text}")
-                return []
+                return None
 
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
-            return []
+            return None
 
     def _score_moment(self, moment: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate virality score for a moment."""
@@ -5,25 +5,107 @@ Handles all database interactions for tracking videos and clips.
 """
 
 import os
+import json
 import logging
+import queue
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cheap prior for ordering discovered videos before the expensive analysis:
+# views per hour since publishing plus the channel's average virality score
+# from earlier analyses. Bound parameters are the two weights.
+_DISCOVERY_PRIORITY_SQL = '''(
+    ? * COALESCE(view_count, 0) / MAX(COALESCE(
+        (julianday('now') - julianday(COALESCE(published_at, discovered_at))) * 24, 1), 1)
+    + ? * COALESCE((
+        SELECT AVG(prior.virality_score) FROM videos AS prior
+        WHERE prior.channel = videos.channel
+          AND prior.status IN ('analyzed', 'processing', 'published')
+    ), 0)
+)'''
+
+DEFAULT_PRIORITY_WEIGHTS = {
+    'view_velocity': 1.0,
+    'channel_virality': 50.0
+}
+
+_INSERT_CLIP_SQL = '''
+    INSERT INTO clips
+    (youtube_id, clip_path, platform, start_time, end_time, moment_type,
+     quote, virality_score, title, description, hashtags, qa_passed,
+     created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+@dataclass(slots=True)
+class VideoRow:
+    """Video record handed through the pipeline phases, with defaults applied once."""
+    youtube_id: str
+    niche: str = 'gaming'
+    title: str = 'Unknown'
+    channel: str = 'Unknown'
+    virality_score: float = 0.0
+    status: str = 'discovered'
+    view_count: int = 0
+    published_at: Optional[str] = None
+    discovered_at: Optional[str] = None
+    url: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'VideoRow':
+        """Build a VideoRow from a videos table row."""
+        return cls(
+            youtube_id=row['youtube_id'],
+            niche=row['niche'] or 'gaming',
+            title=row['title'] or 'Unknown',
+            channel=row['channel'] or 'Unknown',
+            virality_score=float(row['virality_score'] or 0.0),
+            status=row['status'] or 'discovered',
+            view_count=row['view_count'] or 0,
+            published_at=row['published_at'],
+            discovered_at=row['discovered_at'],
+            url=row['url']
+        )
+
+class _SessionConnection:
+    """Connection shared by a Database.session(); close() is deferred to the session."""
+
+    __slots__ = ('_conn',)
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def close(self) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
 class Database:
     """Handle all database operations."""
 
-    def __init__(self, db_path: str = 'data/videos.db'):
+    def __init__(self, db_path: str = 'data/videos.db',
+                 priority_weights: Optional[Dict[str, float]] = None):
         """
         Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            priority_weights: Overrides for DEFAULT_PRIORITY_WEIGHTS, used to
+                order discovered videos for analysis
         """
         self.db_path = db_path
+        self._local = threading.local()
+        weights = {**DEFAULT_PRIORITY_WEIGHTS, **(priority_weights or {})}
+        self._priority_params = (weights['view_velocity'], weights['channel_virality'])
         self._ensure_directory()
         try:
             self._init_tables()
@@ -36,12 +118,51 @@ class Database:
         """Ensure database directory exists."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Create a database connection with row access by column name."""
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with row access by column name."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # In WAL mode NORMAL skips the fsync on every commit; committed
+        # transactions stay consistent and are synced at checkpoints
+        conn.execute('PRAGMA synchronous=NORMAL')
         return conn
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """Create a database connection with row access by column name."""
+        session_conn = getattr(self._local, 'conn', None)
+        if session_conn is not None:
+            return session_conn
+
+        return self._connect()
+
+    @contextmanager
+    def session(self) -> Iterator['Database']:
+        """
+        Reuse one connection for every call made on this thread inside the block.
+
+        Methods still commit their own work; the session only saves opening
+        and closing a connection per call. Nested sessions share the outer
+        connection, and other threads keep using their own connections.
+
+        Yields:
+            This Database instance
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield self
+            return
+
+        conn = self._connect()
+        self._local.conn = _SessionConnection(conn)
+        try:
+            yield self
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            conn.close()
+
     def _ensure_video_columns(self, cursor: sqlite3.Cursor) -> None:
         """Ensure video table includes all expected columns."""
         cursor.execute('PRAGMA table_info(videos)')
@@ -72,6 +193,10 @@ class Database:
             logger.error(f"Failed to create database connection: {e}")
             raise
 
+        # Write-ahead logging lets readers run alongside the status writer
+        # and makes each commit an append instead of a rollback-journal rewrite
+        cursor.execute('PRAGMA journal_mode=WAL')
+
         # Videos table for tracking discovered videos
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS videos (
@@ -97,6 +222,7 @@ class Database:
 
         self._ensure_video_columns(cursor)
         cursor.execute("UPDATE videos SET status = 'discovered' WHERE status IS NULL")
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_videos_channel ON videos(channel)')
 
         # Clips table for tracking generated clips
         cursor.execute('''
@@ -146,6 +272,27 @@ class Database:
             )
         ''')
 
+        # Transcripts and detected moments, so reruns skip Whisper and Gemini.
+        # whisper_model is NULL for transcripts that came from YouTube captions.
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS transcripts (
+                video_id TEXT PRIMARY KEY,
+                transcript_json TEXT,
+                whisper_model TEXT,
+                created_at TEXT
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS moments (
+                video_id TEXT,
+                detector_version TEXT,
+                moments_json TEXT,
+                created_at TEXT,
+                PRIMARY KEY (video_id, detector_version)
+            )
+        ''')
+
         conn.commit()
         conn.close()
 
@@ -259,34 +406,31 @@ class Database:
 
     # Clip operations
 
+    def _clip_params(self, clip_data: Dict[str, Any]) -> tuple:
+        """Build the INSERT parameters for one clip."""
+        return (
+            clip_data.get('youtube_id'),
+            clip_data.get('clip_path'),
+            clip_data.get('platform'),
+            clip_data.get('start_time'),
+            clip_data.get('end_time'),
+            clip_data.get('moment_type'),
+            clip_data.get('quote'),
+            clip_data.get('virality_score'),
+            clip_data.get('title'),
+            clip_data.get('description'),
+            json.dumps(clip_data.get('hashtags', [])),
+            clip_data.get('qa_passed', False),
+            clip_data.get('created_at', datetime.now().isoformat())
+        )
+
     def add_clip(self, clip_data: Dict[str, Any]) -> int:
         """Add a generated clip to database."""
         conn = self._get_connection()
         cursor = conn.cursor()
 
         try:
-            import json
-            cursor.execute('''
-                INSERT INTO clips
-                (youtube_id, clip_path, platform, start_time, end_time, moment_type,
-                 quote, virality_score, title, description, hashtags, qa_passed,
-                 created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                clip_data.get('youtube_id'),
-                clip_data.get('clip_path'),
-                clip_data.get('platform'),
-                clip_data.get('start_time'),
-                clip_data.get('end_time'),
-                clip_data.get('moment_type'),
-                clip_data.get('quote'),
-                clip_data.get('virality_score'),
-                clip_data.get('title'),
-                clip_data.get('description'),
-                json.dumps(clip_data.get('hashtags', [])),
-                clip_data.get('qa_passed', False),
-                clip_data.get('created_at', datetime.now().isoformat())
-            ))
+            cursor.execute(_INSERT_CLIP_SQL, self._clip_params(clip_data))
 
             clip_id = cursor.lastrowid
             conn.commit()
@@ -300,6 +444,39 @@ class Database:
         finally:
             conn.close()
 
+    def add_clips_bulk(self, clips: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add many generated clips in a single transaction.
+
+        Args:
+            clips: Clip dictionaries as accepted by add_clip
+
+        Returns:
+            Clip IDs in input order, or -1 for every clip if the insert failed
+        """
+        if not clips:
+            return []
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            clip_ids = []
+            for clip_data in clips:
+                cursor.execute(_INSERT_CLIP_SQL, self._clip_params(clip_data))
+                clip_ids.append(cursor.lastrowid)
+
+            conn.commit()
+            logger.debug(f"Added {len(clip_ids)} clips")
+            return clip_ids
+
+        except Exception as e:
+            logger.error(f"Error adding clips: {e}")
+            conn.rollback()
+            return [-1] * len(clips)
+        finally:
+            conn.close()
+
     def mark_clip_published(self, clip_id: int, platform_video_id: str,
                             platform: str) -> bool:
         """Mark clip as published."""
@@ -385,23 +562,140 @@ class Database:
         finally:
             conn.close()
 
+    # Transcript and moment cache
+
+    def save_transcript(self, video_id: str, transcript: Dict[str, Any],
+                        whisper_model: Optional[str] = None) -> bool:
+        """
+        Store a video's transcript, replacing any earlier one.
+
+        Args:
+            video_id: YouTube video ID
+            transcript: Transcription dict
+            whisper_model: Whisper model that produced it, None for captions
+
+        Returns:
+            True if stored
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                INSERT OR REPLACE INTO transcripts (video_id, transcript_json, whisper_model, created_at)
+                VALUES (?, ?, ?, ?)
+            ''', (video_id, json.dumps(transcript), whisper_model, datetime.now().isoformat()))
+
+            conn.commit()
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving transcript: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    def get_transcript(self, video_id: str, whisper_model: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a stored transcript.
+
+        Args:
+            video_id: YouTube video ID
+            whisper_model: Only accept Whisper transcripts from this model;
+                caption transcripts are always accepted
+
+        Returns:
+            Transcription dict, or None if not stored
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                SELECT transcript_json FROM transcripts
+                WHERE video_id = ? AND (whisper_model IS NULL OR whisper_model = ?)
+            ''', (video_id, whisper_model))
+            row = cursor.fetchone()
+            return json.loads(row[0]) if row else None
+
+        except Exception as e:
+            logger.error(f"Error getting transcript: {e}")
+            return None
+        finally:
+            conn.close()
+
+    def save_moments(self, video_id: str, detector_version: str,
+                     moments: List[Dict[str, Any]]) -> bool:
+        """
+        Store the moments a detector version found in a video.
+
+        Args:
+            video_id: YouTube video ID
+            detector_version: Version of the detector that produced them
+            moments: Scored moment dicts
+
+        Returns:
+            True if stored
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                INSERT OR REPLACE INTO moments (video_id, detector_version, moments_json, created_at)
+                VALUES (?, ?, ?, ?)
+            ''', (video_id, detector_version, json.dumps(moments), datetime.now().isoformat()))
+
+            conn.commit()
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving moments: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    def get_moments(self, video_id: str, detector_version: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get stored moments for a video and detector version.
+
+        Returns:
+            Moment dicts, or None if not stored
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                SELECT moments_json FROM moments WHERE video_id = ? AND detector_version = ?
+            ''', (video_id, detector_version))
+            row = cursor.fetchone()
+            return json.loads(row[0]) if row else None
+
+        except Exception as e:
+            logger.error(f"Error getting moments: {e}")
+            return None
+        finally:
+            conn.close()
+
     # Phase 2 pipeline methods
 
     def get_discovered_videos(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get all videos not yet analyzed."""
+        """Get all videos not yet analyzed, most promising first."""
         conn = self._get_connection()
         cursor = conn.cursor()
 
         try:
-            cursor.execute('''
-                SELECT * FROM videos 
-                WHERE status = 'discovered' 
-                ORDER BY discovered_at DESC 
+            cursor.execute(f'''
+                SELECT * FROM videos
+                WHERE status = 'discovered'
+                ORDER BY {_DISCOVERY_PRIORITY_SQL} DESC, discovered_at DESC
                 LIMIT ?
-            ''', (limit,))
+            ''', (*self._priority_params, limit))
 
-            rows = cursor.fetchall()
-            return [self._row_to_video_dict(row) for row in rows]
+            return [self._row_to_video_dict(row) for row in cursor.fetchall()]
 
         except Exception as e:
             logger.error(f"Error getting discovered videos: {e}")
@@ -409,6 +703,76 @@ class Database:
         finally:
             conn.close()
 
+    def count_discovered(self, limit: Optional[int] = None) -> int:
+        """
+        Count videos not yet analyzed.
+
+        Args:
+            limit: Stop counting at this many videos
+
+        Returns:
+            Number of discovered videos, capped at limit
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                SELECT COUNT(*) FROM (
+                    SELECT 1 FROM videos WHERE status = 'discovered' LIMIT ?
+                )
+            ''', (-1 if limit is None else limit,))
+            return cursor.fetchone()[0]
+
+        except Exception as e:
+            logger.error(f"Error counting discovered videos: {e}")
+            return 0
+        finally:
+            conn.close()
+
+    def claim_discovered_batch(self, limit: int = 100) -> List[VideoRow]:
+        """
+        Atomically claim a batch of discovered videos for analysis.
+
+        Selects the batch and marks it 'analyzing' in a single UPDATE ...
+        RETURNING statement, so concurrent orchestrators never claim the
+        same video twice. Videos are picked by the discovery priority prior.
+
+        Args:
+            limit: Maximum number of videos to claim
+
+        Returns:
+            List of claimed video rows, most promising first
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(f'''
+                UPDATE videos SET status = 'analyzing'
+                WHERE id IN (
+                    SELECT id FROM videos
+                    WHERE status = 'discovered'
+                    ORDER BY {_DISCOVERY_PRIORITY_SQL} DESC, discovered_at DESC
+                    LIMIT ?
+                )
+                RETURNING *, {_DISCOVERY_PRIORITY_SQL} AS priority
+            ''', (*self._priority_params, limit, *self._priority_params))
+
+            rows = cursor.fetchall()
+            conn.commit()
+
+            # RETURNING does not preserve the subquery order
+            rows.sort(key=lambda row: row['priority'], reverse=True)
+            return [VideoRow.from_row(row) for row in rows]
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error claiming discovered videos: {e}")
+            return []
+        finally:
+            conn.close()
+
     def get_top_analyzed_videos(self, limit: int = 2, threshold: float = 70.0) -> List[Dict[str, Any]]:
         """Get top-scoring analyzed videos above threshold."""
         conn = self._get_connection()
@@ -431,6 +795,107 @@ class Database:
         finally:
             conn.close()
 
+    def release_claimed_videos(self, youtube_ids: List[str]) -> bool:
+        """
+        Return claimed but unanalyzed videos to the discovered pool.
+
+        Args:
+            youtube_ids: Videos previously claimed with claim_discovered_batch
+
+        Returns:
+            True if successful
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.executemany('''
+                UPDATE videos SET status = 'discovered'
+                WHERE youtube_id = ? AND status = 'analyzing'
+            ''', [(youtube_id,) for youtube_id in youtube_ids])
+            conn.commit()
+            return True
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error releasing claimed videos: {e}")
+            return False
+        finally:
+            conn.close()
+
+    def claim_top_analyzed_batch(self, limit: int = 2, threshold: float = 70.0) -> List[VideoRow]:
+        """
+        Atomically claim the top-scoring analyzed videos for clip creation.
+
+        Args:
+            limit: Maximum number of videos to claim
+            threshold: Minimum virality score
+
+        Returns:
+            List of claimed video rows, highest score first
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                UPDATE videos SET status = 'processing'
+                WHERE id IN (
+                    SELECT id FROM videos
+                    WHERE status = 'analyzed' AND virality_score >= ?
+                    ORDER BY virality_score DESC
+                    LIMIT ?
+                )
+                RETURNING *
+            ''', (threshold, limit))
+
+            rows = cursor.fetchall()
+            conn.commit()
+
+            videos = [VideoRow.from_row(row) for row in rows]
+            videos.sort(key=lambda v: v.virality_score, reverse=True)
+            return videos
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error claiming top analyzed videos: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def _status_update(self, youtube_id: str, status: str,
+                       virality_score: Optional[float] = None,
+                       timestamp: Optional[str] = None) -> tuple:
+        """Build the UPDATE statement and parameters for a status change."""
+        timestamp = timestamp or datetime.now().isoformat()
+
+        if status == 'published':
+            return ('''
+                UPDATE videos 
+                SET status = ?, processed = 1, processed_at = ?
+                WHERE youtube_id = ?
+            ''', (status, timestamp, youtube_id))
+
+        if virality_score is None:
+            return ('''
+                UPDATE videos 
+                SET status = ?
+                WHERE youtube_id = ?
+            ''', (status, youtube_id))
+
+        if status == 'analyzed':
+            return ('''
+                UPDATE videos 
+                SET status = ?, virality_score = ?, analyzed_at = ?
+                WHERE youtube_id = ?
+            ''', (status, virality_score, timestamp, youtube_id))
+
+        return ('''
+            UPDATE videos 
+            SET status = ?, virality_score = ?
+            WHERE youtube_id = ?
+        ''', (status, virality_score, youtube_id))
+
     def update_video_status(self, youtube_id: str, status: str, 
                            virality_score: Optional[float] = None) -> bool:
         """Update video status and optionally virality score."""
@@ -438,40 +903,8 @@ class Database:
         cursor = conn.cursor()
 
         try:
-            if virality_score is not None:
-                # Update with virality score
-                if status == 'analyzed':
-                    cursor.execute('''
-                        UPDATE videos 
-                        SET status = ?, virality_score = ?, analyzed_at = ?
-                        WHERE youtube_id = ?
-                    ''', (status, virality_score, datetime.now().isoformat(), youtube_id))
-                elif status == 'published':
-                    cursor.execute('''
-                        UPDATE videos 
-                        SET status = ?, processed = 1, processed_at = ?
-                        WHERE youtube_id = ?
-                    ''', (status, datetime.now().isoformat(), youtube_id))
-                else:
-                    cursor.execute('''
-                        UPDATE videos 
-                        SET status = ?, virality_score = ?
-                        WHERE youtube_id = ?
-                    ''', (status, virality_score, youtube_id))
-            else:
-                # Update status only
-                if status == 'published':
-                    cursor.execute('''
-                        UPDATE videos 
-                        SET status = ?, processed = 1, processed_at = ?
-                        WHERE youtube_id = ?
-                    ''', (status, datetime.now().isoformat(), youtube_id))
-                else:
-                    cursor.execute('''
-                        UPDATE videos 
-                        SET status = ?
-                        WHERE youtube_id = ?
-                    ''', (status, youtube_id))
+            query, params = self._status_update(youtube_id, status, virality_score)
+            cursor.execute(query, params)
 
             conn.commit()
             logger.debug(f"Updated video {youtube_id} status to {status}")
@@ -484,6 +917,29 @@ class Database:
         finally:
             conn.close()
 
+    def _apply_status_updates(self, cursor: sqlite3.Cursor, rows: List[tuple]) -> None:
+        """
+        Execute status updates in order, one executemany per run of rows
+        sharing the same statement shape.
+
+        A video can appear more than once (e.g. 'analyzed' then 'processing'),
+        so rows are never regrouped across runs.
+        """
+        timestamp = datetime.now().isoformat()
+        run_query = None
+        run_params: List[tuple] = []
+
+        for youtube_id, status, virality_score in rows:
+            query, params = self._status_update(youtube_id, status, virality_score, timestamp)
+            if query != run_query and run_params:
+                cursor.executemany(run_query, run_params)
+                run_params = []
+            run_query = query
+            run_params.append(params)
+
+        if run_params:
+            cursor.executemany(run_query, run_params)
+
     # Helper methods
 
     def _row_to_video_dict(self, row) -> Dict[str, Any]:
@@ -508,7 +964,7 @@ class Database:
             }
 
             result['status'] = row_dict.get('status') or 'discovered'
-            result['virality_score'] = row_dict.get('virality_score') or 0.0
+            result['virality_score'] = float(row_dict.get('virality_score') or 0.0)
             result['analyzed_at'] = row_dict.get('analyzed_at')
             result['processed_at'] = row_dict.get('processed_at')
             return result
@@ -533,7 +989,7 @@ class Database:
         }
 
         result['status'] = safe_index(13) or 'discovered'
-        result['virality_score'] = safe_index(14) or 0.0
+        result['virality_score'] = float(safe_index(14) or 0.0)
         result['analyzed_at'] = safe_index(15)
         result['processed_at'] = safe_index(16)
 
@@ -541,7 +997,6 @@ class Database:
 
     def _row_to_clip_dict(self, row) -> Dict[str, Any]:
         """Convert database row to clip dictionary."""
-        import json
         return {
             'id': row[0],
             'youtube_id': row[1],
@@ -562,6 +1017,90 @@ class Database:
             'created_at': row[16]
         }
 
+class StatusWriter(threading.Thread):
+    """
+    Background thread that applies video status updates over one connection.
+
+    Producers call enqueue() from any thread; the writer drains the queue in
+    batches of up to batch_size rows (or whatever arrived within
+    flush_interval seconds) and commits each batch as one transaction.
+    Updates are applied in the order they were enqueued.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db: Database, batch_size: int = 256, flush_interval: float = 0.5):
+        """
+        Initialize the writer. Call start() before enqueueing.
+
+        Args:
+            db: Database whose file the writer connects to
+            batch_size: Maximum updates committed per transaction
+            flush_interval: Seconds to wait for more updates before committing
+        """
+        super().__init__(name='status-writer', daemon=True)
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+
+    def enqueue(self, youtube_id: str, status: str, virality_score: Optional[float] = None) -> None:
+        """Queue a status change for the writer thread."""
+        self._queue.put((youtube_id, status, virality_score))
+
+    def close(self) -> None:
+        """Write outstanding updates and stop the thread."""
+        self._queue.put(self._STOP)
+        self.join()
+
+    def __enter__(self) -> 'StatusWriter':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _next_batch(self) -> List[Any]:
+        """Block for one item, then collect more until the batch is full or the interval ends."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size and batch[-1] is not self._STOP:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def run(self) -> None:
+        """Writer loop: drain, write and commit until close() is called."""
+        conn = self.db._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            while True:
+                batch = self._next_batch()
+                stopping = batch[-1] is self._STOP
+                rows = batch[:-1] if stopping else batch
+
+                if rows:
+                    try:
+                        self.db._apply_status_updates(cursor, rows)
+                        conn.commit()
+                        logger.debug(f"Status writer committed {len(rows)} updates")
+                    except Exception as e:
+                        logger.error(f"Error writing {len(rows)} status updates: {e}")
+                        conn.rollback()
+
+                if stopping:
+                    break
+        finally:
+            conn.close()
+
 def main():
     """Test database operations."""
     db = Database()
@@ -25,6 +25,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 60
+WATCH_URL = "https://www.youtube.com/watch?v={}"
+
 # Configuration
 NICHES = ['Roblox', 'Horror games', 'Fortnite']
 MIN_VIEWS = 10000
@@ -59,7 +62,9 @@ class DiscoveryService:
         # Initialize YouTube API
         try:
             logger.info("Initializing YouTube API...")
-            self.youtube = build('youtube', 'v3', developerKey=api_key)
+            # Bundled discovery document: no discovery fetch or file cache
+            self.youtube = build('youtube', 'v3', developerKey=api_key,
+                                 cache_discovery=False, static_discovery=True)
             # Test connection with a simple query
             self._test_api_connection()
             logger.info("✓ YouTube API initialized successfully")
@@ -117,7 +122,7 @@ class DiscoveryService:
                     'channel': channel,
                     'published_at': published_at,
                     'niche': niche,
-                    'url': f"https://www.youtube.com/watch?v={video_id}"
+                    'url': WATCH_URL.format(video_id)
                 })
             
             logger.info(f"Found {len(videos)} videos for niche: {niche}")
@@ -169,7 +174,7 @@ class DiscoveryService:
                 'published_at': metadata['published_at'],
                 'niche': metadata['niche'],
                 'discovered_at': datetime.now().isoformat(),
-                'url': f"https://www.youtube.com/watch?v={video_id}",
+                'url': metadata.get('url') or WATCH_URL.format(video_id),
                 'metadata_json': json.dumps(metadata)
             })
             logger.debug(f"Video {video_id} saved to database")
@@ -233,9 +238,9 @@ class DiscoveryService:
 
 def main():
     """Main discovery function."""
-    logger.info("="*60)
+    logger.info(_BANNER)
     logger.info("YouTube Discovery Service Started")
-    logger.info("="*60)
+    logger.info(_BANNER)
     
     # Get API key from environment
     api_key = os.getenv('YOUTUBE_API_KEY')
@@ -264,9 +269,9 @@ def main():
             service.save_results([])
             print(json.dumps([]))  # ← OUTPUT EMPTY ARRAY
         
-        logger.info("="*60)
+        logger.info(_BANNER)
         logger.info("Discovery Complete")
-        logger.info("="*60)
+        logger.info(_BANNER)
         sys.exit(0)
     
     except ValueError as e:
@@ -14,8 +14,14 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class VideoDownloader:
-    def __init__(self, output_dir: str = 'data/downloads'):
+    def __init__(self, output_dir: str = 'data/downloads', concurrent_fragments: int = 8):
+        """
+        Args:
+            output_dir: Directory for downloaded videos
+            concurrent_fragments: Fragments of an HLS/DASH stream fetched in parallel
+        """
         self.output_dir = output_dir
+        self.concurrent_fragments = concurrent_fragments
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
     def download(self, video_id: str, quality: str = 'best') -> Optional[str]:
@@ -30,6 +36,9 @@ class VideoDownloader:
             'yt-dlp',
             '-f', 'best[height<=720]',  # Limit to 720p for speed
             '-o', output_template,
+            '--concurrent-fragments', str(self.concurrent_fragments),
+            '--fragment-retries', '3',
+            '--http-chunk-size', '10M',  # Ranged requests avoid per-connection throttling
             '--quiet',
             '--no-warnings',
             url
@@ -5,12 +5,24 @@ Analyzes virality, engagement, and CPM rates to estimate revenue potential.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import math
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Below this many clips the plain loop beats building NumPy arrays
+_VECTORIZE_MIN_CLIPS = 16
+
+# Penalty for a flagged issue missing from SAFETY_PENALTIES
+_DEFAULT_SAFETY_PENALTY = -0.10
+
 class EarningCalculator:
     """Calculate earning potential for video clips based on multiple factors."""
 
@@ -129,6 +141,52 @@ class EarningCalculator:
 
         return result
 
+    def calculate_gate_scores(self, clips: List[Dict[str, Any]]) -> List[Tuple[float, float]]:
+        """
+        Compute the virality and safety scores used to filter clips.
+
+        These are the same values calculate_earning_potential reports, but
+        computed for the whole batch at once (vectorized with NumPy for
+        larger batches), so the full analysis can be limited to clips that
+        pass the filters.
+
+        Args:
+            clips: List of clip data dictionaries
+
+        Returns:
+            (virality_score, safety_score) for each clip, in input order
+        """
+        if not (NUMPY_AVAILABLE and len(clips) >= _VECTORIZE_MIN_CLIPS):
+            return [
+                (clip.get('virality_score', 0) if clip else 0,
+                 self._calculate_safety_score(clip.get('brand_safety', {}) if clip else {}))
+                for clip in clips
+            ]
+
+        issues = list(self.SAFETY_PENALTIES)
+        penalties = np.array([self.SAFETY_PENALTIES[issue] for issue in issues], dtype=np.float64)
+        virality = np.zeros(len(clips), dtype=np.float64)
+        flagged = np.zeros((len(clips), len(issues)), dtype=bool)
+        unknown = np.zeros(len(clips), dtype=np.float64)
+
+        for i, clip in enumerate(clips):
+            if not clip:
+                continue
+            virality[i] = clip.get('virality_score', 0)
+            for issue, severity in (clip.get('brand_safety') or {}).items():
+                if not severity:
+                    continue
+                if issue in self.SAFETY_PENALTIES:
+                    flagged[i, issues.index(issue)] = True
+                else:
+                    unknown[i] += 1
+
+        multiplier = np.prod(np.where(flagged, 1 + penalties, 1.0), axis=1)
+        multiplier *= (1 + _DEFAULT_SAFETY_PENALTY) ** unknown
+        safety = np.clip(100.0 * multiplier, 0, 100)
+
+        return list(zip(virality.tolist(), safety.tolist()))
+
     def _normalize_niche(self, niche: str) -> str:
         """Normalize niche name to standard format."""
         niche = niche.lower().strip()
@@ -197,7 +255,7 @@ class EarningCalculator:
         # Apply penalties for safety issues
         for issue, severity in brand_safety.items():
             if severity:  # If issue is flagged
-                penalty = self.SAFETY_PENALTIES.get(issue, -0.10)
+                penalty = self.SAFETY_PENALTIES.get(issue, _DEFAULT_SAFETY_PENALTY)
                 safety_score *= (1 + penalty)  # Apply as percentage reduction
         
         return max(0, min(100, safety_score))
@@ -226,7 +284,7 @@ class EarningCalculator:
         
         for issue, severity in brand_safety.items():
             if severity:  # If issue is flagged
-                penalty = self.SAFETY_PENALTIES.get(issue, -0.10)
+                penalty = self.SAFETY_PENALTIES.get(issue, _DEFAULT_SAFETY_PENALTY)
                 final_score *= (1 + penalty)  # Apply as percentage reduction
         
         return max(0, min(100, final_score))
@@ -5,55 +5,157 @@ Handles resizing, cropping, and format conversion for social platforms.
 """
 
 import os
+import hashlib
 import logging
 import subprocess
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
-import json
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+
+# orjson parses ffprobe output straight from bytes; stdlib json is the fallback
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True, slots=True)
+class PlatformSpec:
+    """Output geometry and encoder settings for a target platform."""
+    width: int
+    height: int
+    fps: int
+    max_duration: int
+    codec: str
+    audio_codec: str
+    bitrate: str
+    audio_bitrate: str
+
+# Below this many moments the plain loop beats building NumPy arrays
+_VECTORIZE_MIN_MOMENTS = 16
+
 # Platform-specific settings
 PLATFORM_SETTINGS = {
-    'youtube_shorts': {
-        'width': 1080,
-        'height': 1920,
-        'fps': 30,
-        'max_duration': 60,
-        'codec': 'libx264',
-        'audio_codec': 'aac',
-        'bitrate': '3M',
-        'audio_bitrate': '128k'
-    },
-    'tiktok': {
-        'width': 1080,
-        'height': 1920,
-        'fps': 30,
-        'max_duration': 600,
-        'codec': 'libx264',
-        'audio_codec': 'aac',
-        'bitrate': '4M',
-        'audio_bitrate': '128k'
-    },
-    'instagram_reels': {
-        'width': 1080,
-        'height': 1920,
-        'fps': 30,
-        'max_duration': 90,
-        'codec': 'libx264',
-        'audio_codec': 'aac',
-        'bitrate': '3.5M',
-        'audio_bitrate': '128k'
-    }
+    'youtube_shorts': PlatformSpec(1080, 1920, 30, 60, 'libx264', 'aac', '3M', '128k'),
+    'tiktok': PlatformSpec(1080, 1920, 30, 600, 'libx264', 'aac', '4M', '128k'),
+    'instagram_reels': PlatformSpec(1080, 1920, 30, 90, 'libx264', 'aac', '3.5M', '128k')
 }
 
+def clips_within_limits(moments: List[Dict[str, Any]],
+                        platforms: List[str]) -> List[Tuple[Dict[str, Any], str]]:
+    """
+    Pair each moment with the platforms whose max_duration it fits.
+
+    Args:
+        moments: Moments with 'start' and 'end' in seconds
+        platforms: Target platform names
+
+    Returns:
+        (moment, platform) pairs in moment-major order
+    """
+    if NUMPY_AVAILABLE and len(moments) >= _VECTORIZE_MIN_MOMENTS:
+        durations = np.fromiter(
+            (moment['end'] - moment['start'] for moment in moments),
+            dtype=np.float64, count=len(moments)
+        )
+        caps = np.array([PLATFORM_SETTINGS[platform].max_duration for platform in platforms],
+                        dtype=np.float64)
+        # Row-major nonzero keeps moment-major, platform-minor order
+        rows, cols = np.nonzero(durations[:, None] <= caps)
+        return [(moments[i], platforms[j]) for i, j in zip(rows.tolist(), cols.tolist())]
+
+    limits = [(platform, PLATFORM_SETTINGS[platform].max_duration) for platform in platforms]
+
+    pairs = []
+    for moment in moments:
+        duration = moment['end'] - moment['start']
+        pairs.extend((moment, platform) for platform, limit in limits if duration <= limit)
+    return pairs
+
+def _platform_spec(platform: str) -> PlatformSpec:
+    """Settings for a platform, defaulting to YouTube Shorts."""
+    return PLATFORM_SETTINGS.get(platform, PLATFORM_SETTINGS['youtube_shorts'])
+
+@lru_cache(maxsize=None)
+def _encode_args(settings: PlatformSpec) -> Tuple[str, ...]:
+    """ffmpeg output options for a platform's encoder settings, built once per spec."""
+    return (
+        '-c:v', settings.codec,
+        '-b:v', settings.bitrate,
+        '-c:a', settings.audio_codec,
+        '-b:a', settings.audio_bitrate,
+        '-r', str(settings.fps),
+        '-movflags', '+faststart'
+    )
+
+@lru_cache(maxsize=None)
+def _spec_fingerprint(settings: PlatformSpec) -> str:
+    """Stable text form of a spec, for naming clips by encoder settings."""
+    return repr(settings)
+
+@lru_cache(maxsize=64)
+def _crop_filter(original_width: int, original_height: int, settings: PlatformSpec) -> str:
+    """Build the centered crop+scale filter for a source size and platform."""
+    # For vertical video (9:16), we want to crop to maintain aspect ratio
+    target_aspect = settings.height / settings.width
+    video_aspect = original_height / original_width
+
+    if video_aspect > target_aspect:
+        # Video is already tall enough, crop top/bottom
+        crop_height = int(original_width * target_aspect)
+        crop_y = int((original_height - crop_height) / 2)
+        return f"crop={original_width}:{crop_height}:0:{crop_y},scale={settings.width}:{settings.height}"
+
+    # Video needs horizontal crop
+    crop_width = int(original_height / target_aspect)
+    crop_x = int((original_width - crop_width) / 2)
+    return f"crop={crop_width}:{original_height}:{crop_x}:0,scale={settings.width}:{settings.height}"
+
+# ffprobe codec names produced by the encoders in PLATFORM_SETTINGS
+_ENCODER_CODECS = {'libx264': 'h264', 'libx265': 'hevc'}
+
+def _can_stream_copy(stream: Dict[str, Any], settings: PlatformSpec) -> bool:
+    """Whether a source video stream already has a platform's codec, size and frame rate."""
+    try:
+        fps = float(Fraction(stream['avg_frame_rate']))
+    except (KeyError, ValueError, ZeroDivisionError):
+        return False
+    return (stream.get('codec_name') == _ENCODER_CODECS.get(settings.codec)
+            and int(stream.get('width', 0)) == settings.width
+            and int(stream.get('height', 0)) == settings.height
+            and abs(fps - settings.fps) < 0.01)
+
+def _discard_partial_clips(paths: Dict[str, Path]) -> None:
+    """Remove temporary .part.mp4 outputs left behind by a failed encode."""
+    for path in paths.values():
+        part = path.with_suffix('.part.mp4')
+        if part.exists():
+            part.unlink()
+
 class VideoEditor:
     """Edit and process videos for social media platforms."""
 
-    def __init__(self, output_dir: str = 'data/clips'):
+    def __init__(self, output_dir: str = 'data/clips', hwaccel: Optional[str] = None):
+        """
+        Args:
+            output_dir: Directory for encoded clips
+            hwaccel: ffmpeg -hwaccel method for decoding sources before
+                re-encoding ('auto', 'cuda', 'videotoolbox', ...), or None
+                to decode on the CPU
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.hwaccel = hwaccel
 
     def extract_clip(self, video_path: str, start_time: float, end_time: float,
                      output_path: Optional[str] = None) -> Optional[str]:
@@ -89,7 +191,7 @@ class VideoEditor:
         """
         Resize and crop video to vertical format (9:16) for social platforms.
         """
-        settings = PLATFORM_SETTINGS.get(platform, PLATFORM_SETTINGS['youtube_shorts'])
+        settings = _platform_spec(platform)
 
         if output_path is None:
             input_stem = Path(input_path).stem
@@ -98,52 +200,22 @@ class VideoEditor:
 
         try:
             # Get video info first
-            probe_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-select_streams', 'v:0',
-                '-show_entries', 'stream=width,height',
-                '-of', 'json',
-                input_path
-            ]
-
-            result = subprocess.run(probe_cmd, capture_output=True, text=True)
-            info = json.loads(result.stdout)
-            streams = info.get('streams', [])
-            if not streams:
+            dimensions = self._probe_dimensions(input_path)
+            if not dimensions:
                 logger.error("Could not get video dimensions")
                 return None
 
-            original_width = int(streams[0]['width'])
-            original_height = int(streams[0]['height'])
+            original_width, original_height = dimensions
 
             # Calculate crop dimensions to center the content
-            # For vertical video (9:16), we want to crop to maintain aspect ratio
-            target_aspect = settings['height'] / settings['width']
-            video_aspect = original_height / original_width
-
-            if video_aspect > target_aspect:
-                # Video is already tall enough, crop top/bottom
-                crop_height = int(original_width * target_aspect)
-                crop_y = int((original_height - crop_height) / 2)
-                crop_filter = f"crop={original_width}:{crop_height}:0:{crop_y},scale={settings['width']}:{settings['height']}"
-            else:
-                # Video needs horizontal crop
-                crop_width = int(original_height / target_aspect)
-                crop_x = int((original_width - crop_width) / 2)
-                crop_filter = f"crop={crop_width}:{original_height}:{crop_x}:0,scale={settings['width']}:{settings['height']}"
+            crop_filter = _crop_filter(original_width, original_height, settings)
 
             # Build FFmpeg command
             cmd = [
                 'ffmpeg',
                 '-i', input_path,
                 '-vf', crop_filter,
-                '-c:v', settings['codec'],
-                '-b:v', settings['bitrate'],
-                '-c:a', settings['audio_codec'],
-                '-b:a', settings['audio_bitrate'],
-                '-r', str(settings['fps']),
-                '-movflags', '+faststart',
+                *_encode_args(settings),
                 '-y',
                 output_path
             ]
@@ -159,19 +231,171 @@ class VideoEditor:
             logger.error(f"Error resizing video: {e}")
             return None
 
+    def _probe_video_stream(self, video_path: str) -> Optional[Dict[str, Any]]:
+        """Get size, codec and frame rate of the first video stream with ffprobe."""
+        probe_cmd = [
+            'ffprobe',
+            '-v', 'error',
+            '-select_streams', 'v:0',
+            '-show_entries', 'stream=width,height,codec_name,avg_frame_rate',
+            '-of', 'json',
+            video_path
+        ]
+
+        result = subprocess.run(probe_cmd, capture_output=True)
+        streams = _json.loads(result.stdout).get('streams', [])
+        return streams[0] if streams else None
+
+    def _probe_dimensions(self, video_path: str) -> Optional[Tuple[int, int]]:
+        """Get (width, height) of the first video stream with ffprobe."""
+        stream = self._probe_video_stream(video_path)
+        if not stream:
+            return None
+        return int(stream['width']), int(stream['height'])
+
+    def _clip_output_path(self, clip_stem: str, start_time: float, end_time: float,
+                          platform: str) -> Path:
+        """
+        Path of an encoded clip, unique to its exact times and encoder settings.
+
+        Reruns of the same moment map to the same file, so it can be reused.
+        """
+        fingerprint = _spec_fingerprint(_platform_spec(platform))
+        digest = hashlib.sha1(f"{start_time}:{end_time}:{fingerprint}".encode()).hexdigest()[:10]
+        return self.output_dir / f"{clip_stem}_{platform}_{digest}.mp4"
+
+    def process_clip_for_all_platforms(self, video_path: str, start_time: float, end_time: float,
+                                       platforms: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Cut one moment and encode it for several platforms in a single ffmpeg run.
+
+        The segment is decoded once and split into a crop/scale branch per
+        platform, instead of one extract and re-encode per platform. When
+        the source already has a platform's codec, size and frame rate, that
+        output's video is stream-copied instead of re-encoded (cut at the
+        nearest keyframe); its audio is still encoded to the platform codec.
+        Clips already encoded by an earlier run are reused; new ones are
+        written to a temporary name and renamed into place, so an
+        interrupted run never leaves a partial clip behind under the final
+        name.
+
+        Args:
+            video_path: Source video
+            start_time: Clip start in seconds
+            end_time: Clip end in seconds
+            platforms: Target platform names
+
+        Returns:
+            Dictionary mapping each platform to its clip path, or None on failure
+        """
+        if not platforms:
+            return {}
+
+        clip_stem = f"{Path(video_path).stem}_{start_time:.0f}-{end_time:.0f}"
+        paths = {
+            platform: self._clip_output_path(clip_stem, start_time, end_time, platform)
+            for platform in platforms
+        }
+        clips = {platform: str(path) if path.exists() else None for platform, path in paths.items()}
+        pending = [platform for platform in platforms if clips[platform] is None]
+        if not pending:
+            logger.info(f"Reusing encoded {clip_stem} for {', '.join(platforms)}")
+            return clips
+
+        try:
+            stream = self._probe_video_stream(video_path)
+            if not stream:
+                logger.error("Could not get video dimensions")
+                return clips
+            dimensions = int(stream['width']), int(stream['height'])
+
+            copied = [platform for platform in pending if _can_stream_copy(stream, _platform_spec(platform))]
+            encoded = [platform for platform in pending if platform not in copied]
+
+            outputs = []
+            for platform in copied:
+                settings = _platform_spec(platform)
+                # Only video is checked against the spec, so audio is always
+                # encoded; re-encoding it is cheap next to the video
+                outputs += [
+                    '-map', '0:v:0',
+                    '-map', '0:a?',
+                    '-c:v', 'copy',
+                    '-c:a', settings.audio_codec,
+                    '-b:a', settings.audio_bitrate,
+                    '-movflags', '+faststart',
+                    str(paths[platform].with_suffix('.part.mp4'))
+                ]
+
+            graph = []
+            if encoded:
+                branches = ''.join(f"[v{i}]" for i in range(len(encoded)))
+                graph.append(f"[0:v]split={len(encoded)}{branches}")
+            for i, platform in enumerate(encoded):
+                settings = _platform_spec(platform)
+                graph.append(f"[v{i}]{_crop_filter(*dimensions, settings)}[out{i}]")
+                outputs += [
+                    '-map', f"[out{i}]",
+                    '-map', '0:a?',
+                    *_encode_args(settings),
+                    str(paths[platform].with_suffix('.part.mp4'))
+                ]
+
+            # Hardware decode only matters when frames are decoded for a filter graph
+            hwaccel = ['-hwaccel', self.hwaccel] if self.hwaccel and graph else []
+
+            cmd = [
+                'ffmpeg',
+                *hwaccel,
+                '-ss', str(start_time),
+                '-t', str(end_time - start_time),
+                '-i', video_path,
+                *(['-filter_complex', ';'.join(graph)] if graph else []),
+                '-y',
+                *outputs
+            ]
+
+            subprocess.run(cmd, check=True, capture_output=True)
+            for platform in pending:
+                os.replace(paths[platform].with_suffix('.part.mp4'), paths[platform])
+                clips[platform] = str(paths[platform])
+            logger.info(f"Encoded {clip_stem} for {', '.join(pending)} "
+                        f"({len(copied)}/{len(pending)} stream-copied)")
+            return clips
+
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to encode clip for {', '.join(pending)}: {e.stderr.decode()}")
+            _discard_partial_clips(paths)
+            return clips
+        except Exception as e:
+            logger.error(f"Error encoding clip for {', '.join(pending)}: {e}")
+            _discard_partial_clips(paths)
+            return clips
+
     def process_clip_for_platform(self, video_path: str, start_time: float, end_time: float,
                                    platform: str) -> Optional[str]:
         """
         Full pipeline: extract clip and convert to platform-specific format.
+
+        Intermediate files are named per platform, so several platforms of
+        the same moment can be processed concurrently.
         """
+        clip_stem = f"{Path(video_path).stem}_{start_time:.0f}-{end_time:.0f}"
+
         # First extract raw clip
-        raw_clip = self.extract_clip(video_path, start_time, end_time)
+        raw_clip = self.extract_clip(
+            video_path, start_time, end_time,
+            output_path=str(self.output_dir / f"{clip_stem}_{platform}_raw.mp4")
+        )
         if not raw_clip:
             return None
 
         try:
             # Convert to platform format
-            final_clip = self.resize_to_vertical(raw_clip, platform)
+            final_clip = self.resize_to_vertical(
+                raw_clip, platform,
+                output_path=str(self.output_dir / f"{clip_stem}_{platform}.mp4")
+            )
 
             # Cleanup raw clip
             if os.path.exists(raw_clip) and raw_clip != final_clip:
@@ -302,8 +526,8 @@ class VideoEditor:
                 video_path
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            info = json.loads(result.stdout)
+            result = subprocess.run(cmd, capture_output=True)
+            info = _json.loads(result.stdout)
             duration = float(info['format']['duration'])
             return duration
 
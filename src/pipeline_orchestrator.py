@@ -6,18 +6,80 @@ Coordinates analysis and creation phases for optimal resource usage.
 
 import os
 import sys
+import functools
+import json
 import logging
-from typing import Dict, Any, List, Optional
+import queue
+import threading
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from heapq import nlargest
+from operator import itemgetter
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple
 
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from database import Database
-from processor import VideoProcessor
+from database import Database, StatusWriter, VideoRow
+from processor import ProcessOutcome, VideoProcessor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 60
+
+
+def _bounded_completed(executor: ThreadPoolExecutor, fn: Callable, items: Iterable[VideoRow],
+                       max_in_flight: int, stop: Optional[threading.Event] = None,
+                       **kwargs) -> Iterator[Tuple[Any, VideoRow]]:
+    """
+    Submit fn(video=item) for each item, keeping at most max_in_flight pending.
+
+    Items are pulled from the iterable only as earlier futures finish, so a
+    lazy source is never fully materialized. Once ``stop`` is set no more
+    items are pulled, queued futures are cancelled and only already-running
+    ones are yielded.
+
+    Yields:
+        (future, item) pairs in completion order
+    """
+    items = iter(items)
+    in_flight = {}
+
+    for item in items:
+        in_flight[executor.submit(fn, video=item, **kwargs)] = item
+        if len(in_flight) >= max_in_flight:
+            break
+
+    while in_flight:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future, in_flight.pop(future)
+
+            if stop is not None and stop.is_set():
+                for pending in [f for f in in_flight if f.cancel()]:
+                    del in_flight[pending]
+                continue
+
+            item = next(items, None)
+            if item is not None:
+                in_flight[executor.submit(fn, video=item, **kwargs)] = item
+
+
+def _log_compact_summary(phase: str, results: Dict[str, Any]) -> None:
+    """Log a phase's scalar counters as a single JSON line."""
+    summary = {key: value for key, value in results.items() if not isinstance(value, list)}
+    logger.info("%s %s", phase, json.dumps(summary, default=str))
+
+
+def _db_session(method: Callable) -> Callable:
+    """Run an orchestrator method inside a single Database.session()."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.db.session():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class PipelineOrchestrator:
     """Manages two-phase video processing pipeline."""
@@ -30,7 +92,7 @@ class PipelineOrchestrator:
             config: Configuration dictionary
         """
         self.config = config
-        self.db = Database()
+        self.db = Database(priority_weights=config.get('processing', {}).get('priority_weights'))
         self.processor = VideoProcessor(config)
 
         # Get processing config
@@ -38,105 +100,218 @@ class PipelineOrchestrator:
         self.max_videos_to_analyze = processing_config.get('max_videos_to_analyze', 100)
         self.virality_threshold = processing_config.get('virality_threshold', 70)
         self.max_videos_to_process = processing_config.get('max_videos_to_process', 2)
+        self.analysis_workers = processing_config.get('analysis_workers', 8)
+        self.status_batch_size = processing_config.get('status_batch_size', 25)
+        self.status_flush_interval = processing_config.get('status_flush_interval_ms', 500) / 1000
+        self.pipelined = processing_config.get('pipelined', False)
+        self.analysis_target_multiplier = processing_config.get('analysis_target_multiplier', 3)
+        self.prefetch_downloads = processing_config.get('prefetch_downloads', 0)
+        self.creation_workers = processing_config.get(
+            'creation_workers', config.get('video_processing', {}).get('max_parallel', 2)
+        )
+
+        logger.info("Orchestrator initialized - Analyze: %s, Threshold: %s, Process: %s, "
+                    "Analysis workers: %s", self.max_videos_to_analyze, self.virality_threshold,
+                    self.max_videos_to_process, self.analysis_workers)
 
-        logger.info(f"Orchestrator initialized - Analyze: {self.max_videos_to_analyze}, "
-                   f"Threshold: {self.virality_threshold}, Process: {self.max_videos_to_process}")
+        # Multi-line phase summaries, or one JSON line per phase when False
+        self.verbose_summary = config.get('system', {}).get('verbose_summary', True)
+
+        # Shared by both phases while a run is in progress
+        self._writer: Optional[StatusWriter] = None
+
+    @contextmanager
+    def _status_writer(self) -> Iterator[StatusWriter]:
+        """
+        Provide the status writer for the current run, starting one if needed.
 
-    def run_phase_1_analysis(self) -> Dict[str, Any]:
+        Nested uses (the phases inside run_pipelined) share the outer writer,
+        so every status change goes through one ordered queue. Outstanding
+        updates are written and the writer stopped when the outermost block
+        exits.
+        """
+        if self._writer is not None:
+            yield self._writer
+            return
+
+        writer = StatusWriter(self.db, batch_size=self.status_batch_size,
+                              flush_interval=self.status_flush_interval)
+        self._writer = writer
+        try:
+            with writer:
+                yield writer
+        finally:
+            self._writer = None
+
+    @_db_session
+    def run_phase_1_analysis(self, creation_queue: Optional[queue.Queue] = None) -> Dict[str, Any]:
         """
         Phase 1: Analyze all discovered videos without downloading.
 
+        Args:
+            creation_queue: Optional queue that receives each video scoring
+                above the threshold as soon as it is analyzed (pipelined mode)
+
         Returns:
             Results summary
         """
-        logger.info("="*60)
+        logger.info(_BANNER)
         logger.info("PHASE 1: ANALYSIS - Analyzing discovered videos")
-        logger.info("="*60)
+        logger.info(_BANNER)
 
         results = {
             'phase': 'analysis',
             'videos_analyzed': 0,
             'videos_above_threshold': 0,
             'failures': 0,
-            'scores': []
+            'scores': [],
+            'top_scores': []
         }
 
-        # Get discovered videos
-        discovered_videos = self.db.get_discovered_videos(limit=self.max_videos_to_analyze)
+        total = self.db.count_discovered(limit=self.max_videos_to_analyze)
 
-        if not discovered_videos:
+        if not total:
             logger.info("No discovered videos to analyze")
             return results
 
-        logger.info(f"Found {len(discovered_videos)} videos to analyze")
-
-        # Analyze each video
-        for idx, video in enumerate(discovered_videos, 1):
-            video_id = video['youtube_id']
-            niche = video.get('niche', 'gaming')
-
-            logger.info(f"\n[{idx}/{len(discovered_videos)}] Analyzing video: {video_id}")
-            logger.info(f"  Title: {video.get('title', 'Unknown')}")
-            logger.info(f"  Channel: {video.get('channel', 'Unknown')}")
-
-            try:
-                # Process video in analysis mode (no download)
-                result = self.processor.process_video(
-                    video_id=video_id,
-                    niche=niche,
-                    phase='analysis'
-                )
-
-                if result.get('success'):
-                    virality_score = result.get('virality_score', 0.0)
-                    
-                    # Update database with analysis results
-                    self.db.update_video_status(
-                        youtube_id=video_id,
-                        status='analyzed',
-                        virality_score=virality_score
-                    )
-
-                    results['videos_analyzed'] += 1
-                    results['scores'].append({
-                        'video_id': video_id,
-                        'score': virality_score,
-                        'title': video.get('title', '')
-                    })
-
-                    if virality_score >= self.virality_threshold:
-                        results['videos_above_threshold'] += 1
-                        logger.info(f"  ✓ Virality score: {virality_score:.1f} (ABOVE THRESHOLD)")
-                    else:
-                        logger.info(f"  ✓ Virality score: {virality_score:.1f} (below threshold)")
-                else:
-                    logger.warning(f"  ✗ Analysis failed: {result.get('errors', [])}")
-                    self.db.update_video_status(video_id, 'failed')
-                    results['failures'] += 1
-
-            except Exception as e:
-                logger.error(f"  ✗ Error analyzing video {video_id}: {e}")
-                self.db.update_video_status(video_id, 'failed')
-                results['failures'] += 1
-
-        # Sort scores by virality
-        results['scores'].sort(key=lambda x: x['score'], reverse=True)
+        logger.info("Found %d videos to analyze with %d workers", total, self.analysis_workers)
+        log_info = logger.isEnabledFor(logging.INFO)
+
+        # Bind loop-invariant lookups to locals for the per-video loop
+        threshold = self.virality_threshold
+        process_video = self.processor.process_video
+        scores_append = results['scores'].append
+
+        # Stop analyzing once Phase 2 has enough candidates to choose from
+        target = self.analysis_target_multiplier * self.max_videos_to_process
+        stop_analysis = threading.Event()
+
+        # Videos are claimed in small batches and submitted as workers free
+        # up, so only a bounded window of rows is held in memory
+        max_in_flight = self.analysis_workers * 2
+        claimed = set()
+        discovered_videos = self._iter_claimed_videos(self.max_videos_to_analyze, max_in_flight,
+                                                      claimed)
+
+        # Analysis is network-bound (captions API, Gemini), so run videos
+        # concurrently. Results are consumed on this thread as they complete
+        # and status changes are handed to the background writer.
+        try:
+            with self._status_writer() as writer, \
+                    ThreadPoolExecutor(max_workers=self.analysis_workers) as executor:
+                enqueue = writer.enqueue
+
+                completed = _bounded_completed(executor, process_video, discovered_videos,
+                                               max_in_flight, stop=stop_analysis,
+                                               phase='analysis')
+                for idx, (future, video) in enumerate(completed, 1):
+                    video_id = video.youtube_id
+                    claimed.discard(video_id)
+
+                    if log_info:
+                        logger.info("\n[%d/%d] Analyzed video: %s", idx, total, video_id)
+                        logger.info("  Title: %s", video.title)
+                        logger.info("  Channel: %s", video.channel)
+
+                    try:
+                        outcome = ProcessOutcome.from_result(future.result())
+
+                        if outcome.success:
+                            virality_score = outcome.virality_score
+
+                            # Queue database update with analysis results
+                            enqueue(video_id, 'analyzed', virality_score)
+
+                            results['videos_analyzed'] += 1
+                            scores_append({
+                                'video_id': video_id,
+                                'score': virality_score,
+                                'title': video.title
+                            })
+
+                            if virality_score >= threshold:
+                                results['videos_above_threshold'] += 1
+                                logger.info("  ✓ Virality score: %.1f (ABOVE THRESHOLD)",
+                                            virality_score)
+
+                                if creation_queue is not None:
+                                    # The writer applies updates in order, so Phase 2's
+                                    # status changes land after this score
+                                    video.status = 'analyzed'
+                                    video.virality_score = virality_score
+                                    creation_queue.put(video)
+
+                                if (target and results['videos_above_threshold'] >= target
+                                        and not stop_analysis.is_set()):
+                                    logger.info("Reached %d videos above threshold, "
+                                                "stopping analysis early", target)
+                                    stop_analysis.set()
+                            else:
+                                logger.info("  ✓ Virality score: %.1f (below threshold)",
+                                            virality_score)
+                        else:
+                            logger.warning("  ✗ Analysis failed: %s", list(outcome.errors))
+                            enqueue(video_id, 'failed')
+                            results['failures'] += 1
+
+                    except Exception as e:
+                        logger.error("  ✗ Error analyzing video %s: %s", video_id, e)
+                        enqueue(video_id, 'failed')
+                        results['failures'] += 1
+
+        finally:
+            # Hand back videos that were claimed but never analyzed
+            if claimed:
+                self.db.release_claimed_videos(list(claimed))
+
+        # Only the top 5 are reported, so avoid sorting the full list
+        results['top_scores'] = nlargest(5, results['scores'], key=itemgetter('score'))
 
         # Print summary
-        logger.info("\n" + "="*60)
+        if not self.verbose_summary:
+            _log_compact_summary('phase1', results)
+            return results
+
+        logger.info("\n%s", _BANNER)
         logger.info("PHASE 1 COMPLETE: Analysis Summary")
-        logger.info("="*60)
-        logger.info(f"Videos analyzed: {results['videos_analyzed']}")
-        logger.info(f"Videos above threshold ({self.virality_threshold}): {results['videos_above_threshold']}")
-        logger.info(f"Failures: {results['failures']}")
+        logger.info(_BANNER)
+        logger.info("Videos analyzed: %d", results['videos_analyzed'])
+        logger.info("Videos above threshold (%s): %d", self.virality_threshold,
+                    results['videos_above_threshold'])
+        logger.info("Failures: %d", results['failures'])
 
-        if results['scores']:
+        if results['top_scores']:
             logger.info("\nTop 5 videos by virality score:")
-            for i, score_data in enumerate(results['scores'][:5], 1):
-                logger.info(f"  {i}. {score_data['video_id']} - {score_data['score']:.1f} - {score_data['title'][:50]}")
+            for i, score_data in enumerate(results['top_scores'], 1):
+                short_title = score_data['title'][:50]
+                logger.info("  %d. %s - %.1f - %s", i, score_data['video_id'],
+                            score_data['score'], short_title)
 
         return results
 
+    def _iter_claimed_videos(self, limit: int, batch_size: int,
+                             claimed: set) -> Iterator[VideoRow]:
+        """
+        Claim discovered videos batch by batch, yielding them one at a time.
+
+        Args:
+            limit: Maximum number of videos to claim in total
+            batch_size: Videos claimed per transaction
+            claimed: Set that receives the youtube_id of every claimed video
+
+        Yields:
+            Claimed video rows
+        """
+        remaining = limit
+        while remaining > 0:
+            batch = self.db.claim_discovered_batch(limit=min(batch_size, remaining))
+            if not batch:
+                return
+            remaining -= len(batch)
+            claimed.update(video.youtube_id for video in batch)
+            yield from batch
+
+    @_db_session
     def run_phase_2_creation(self) -> Dict[str, Any]:
         """
         Phase 2: Download and process top-scoring videos.
@@ -144,90 +319,215 @@ class PipelineOrchestrator:
         Returns:
             Results summary
         """
-        logger.info("="*60)
+        logger.info(_BANNER)
         logger.info("PHASE 2: CREATION - Processing top videos")
-        logger.info("="*60)
+        logger.info(_BANNER)
 
-        results = {
-            'phase': 'creation',
-            'videos_processed': 0,
-            'clips_generated': 0,
-            'failures': 0,
-            'published_videos': []
-        }
+        results = self._new_creation_results()
 
-        # Get top analyzed videos
-        top_videos = self.db.get_top_analyzed_videos(
+        # Claim top analyzed videos (marked 'processing' in the same transaction)
+        top_videos = self.db.claim_top_analyzed_batch(
             limit=self.max_videos_to_process,
             threshold=self.virality_threshold
         )
 
         if not top_videos:
-            logger.info(f"No analyzed videos above threshold ({self.virality_threshold}) to process")
+            logger.info("No analyzed videos above threshold (%s) to process", self.virality_threshold)
             return results
 
-        logger.info(f"Found {len(top_videos)} videos to process")
+        total = len(top_videos)
+        workers = max(1, min(self.creation_workers, total))
+        logger.info("Found %d videos to process with %d workers", total, workers)
 
-        # Process each video
-        for idx, video in enumerate(top_videos, 1):
-            video_id = video['youtube_id']
-            niche = video.get('niche', 'gaming')
-            virality_score = video.get('virality_score', 0.0)
+        log_info = logger.isEnabledFor(logging.INFO)
+        record_outcome = self._record_creation_outcome
 
-            logger.info(f"\n[{idx}/{len(top_videos)}] Processing video: {video_id}")
-            logger.info(f"  Title: {video.get('title', 'Unknown')}")
-            logger.info(f"  Virality Score: {virality_score:.1f}")
+        # Download, encode and upload several videos at once. Outcomes are
+        # merged on this thread, so the results summary needs no locking.
+        with self._status_writer() as writer, ThreadPoolExecutor(max_workers=workers) as executor:
+            if self.prefetch_downloads > 0:
+                completed = self._prefetched_completed(executor, top_videos, workers)
+            else:
+                futures = {
+                    executor.submit(self._process_one_creation, video): video
+                    for video in top_videos
+                }
+                completed = ((future, futures[future]) for future in as_completed(futures))
 
-            try:
-                # Mark as processing
-                self.db.update_video_status(video_id, 'processing')
-
-                # Process video in creation mode (full pipeline with download)
-                result = self.processor.process_video(
-                    video_id=video_id,
-                    niche=niche,
-                    phase='creation'
-                )
-
-                if result.get('success'):
-                    clips_count = len(result.get('clips_generated', []))
-                    
-                    # Update database - mark as published
-                    self.db.update_video_status(video_id, 'published')
-
-                    results['videos_processed'] += 1
-                    results['clips_generated'] += clips_count
-                    results['published_videos'].append({
-                        'video_id': video_id,
-                        'clips_count': clips_count,
-                        'virality_score': virality_score
-                    })
-
-                    logger.info(f"  ✓ Generated {clips_count} clips")
-                else:
-                    logger.warning(f"  ✗ Processing failed: {result.get('errors', [])}")
-                    self.db.update_video_status(video_id, 'failed')
-                    results['failures'] += 1
-
-            except Exception as e:
-                logger.error(f"  ✗ Error processing video {video_id}: {e}")
-                self.db.update_video_status(video_id, 'failed')
-                results['failures'] += 1
+            for idx, (future, video) in enumerate(completed, 1):
 
-        # Print summary
-        logger.info("\n" + "="*60)
+                if log_info:
+                    logger.info("\n[%d/%d] Processed video: %s", idx, total, video.youtube_id)
+                    logger.info("  Title: %s", video.title)
+                    logger.info("  Virality Score: %.1f", video.virality_score)
+
+                record_outcome(video, future.result(), results, writer.enqueue)
+
+        self._log_creation_summary(results)
+        return results
+
+    def _prefetched_completed(self, executor: ThreadPoolExecutor, top_videos: List[VideoRow],
+                              workers: int) -> Iterator[Tuple[Any, VideoRow]]:
+        """
+        Run creation jobs while a separate thread downloads the next videos.
+
+        Downloads are network-bound and encoding is CPU-bound, so the
+        download thread stays up to ``prefetch_downloads`` videos ahead of
+        the creation workers instead of each worker downloading in turn.
+
+        Args:
+            executor: Creation worker pool
+            top_videos: Videos already claimed with status 'processing'
+            workers: Maximum videos processed at once
+
+        Yields:
+            (future, video) pairs in completion order
+        """
+        downloaded = queue.Queue(maxsize=self.prefetch_downloads)
+        paths = {}
+        download = self.processor.downloader.download
+
+        def download_all() -> None:
+            for video in top_videos:
+                try:
+                    path = download(video.youtube_id)
+                except Exception as e:
+                    # The creation job retries the download itself
+                    logger.warning("  Prefetch failed for %s: %s", video.youtube_id, e)
+                    path = None
+                downloaded.put((video, path))
+
+        threading.Thread(target=download_all, name='prefetch', daemon=True).start()
+
+        def next_downloaded() -> Iterator[VideoRow]:
+            for _ in top_videos:
+                video, path = downloaded.get()
+                paths[video.youtube_id] = path
+                yield video
+
+        def create(video: VideoRow) -> ProcessOutcome:
+            return self._process_one_creation(video, paths.pop(video.youtube_id, None))
+
+        return _bounded_completed(executor, create, next_downloaded(), workers)
+
+    def _new_creation_results(self) -> Dict[str, Any]:
+        """Create an empty Phase 2 results summary."""
+        return {
+            'phase': 'creation',
+            'videos_processed': 0,
+            'clips_generated': 0,
+            'failures': 0,
+            'published_videos': []
+        }
+
+    def _process_one_creation(self, video: VideoRow,
+                              video_path: Optional[str] = None) -> ProcessOutcome:
+        """
+        Run the creation pipeline for one video.
+
+        Safe to call from worker threads: it touches no shared results.
+
+        Args:
+            video: Video row already claimed with status 'processing'
+            video_path: Source video already downloaded by the prefetcher
+
+        Returns:
+            Outcome of the creation run
+        """
+        try:
+            # Process video in creation mode (full pipeline with download)
+            result = self.processor.process_video(
+                phase='creation',
+                video=video,
+                video_path=video_path
+            )
+            return ProcessOutcome.from_result(result)
+
+        except Exception as e:
+            logger.error("  ✗ Error processing video %s: %s", video.youtube_id, e)
+            return ProcessOutcome(video.youtube_id, errors=(str(e),))
+
+    def _record_creation_outcome(self, video: VideoRow, outcome: ProcessOutcome,
+                                 results: Dict[str, Any],
+                                 enqueue: Callable[..., None]) -> None:
+        """
+        Merge one video's creation outcome into the Phase 2 results.
+
+        Args:
+            video: Video the outcome belongs to
+            outcome: Result of _process_one_creation
+            results: Phase 2 results summary to update
+            enqueue: StatusWriter.enqueue for the final status change
+        """
+        video_id = video.youtube_id
+
+        if outcome.success:
+            clips_count = len(outcome.clips_generated)
+
+            # Queue database update - mark as published
+            enqueue(video_id, 'published')
+
+            results['videos_processed'] += 1
+            results['clips_generated'] += clips_count
+            results['published_videos'].append({
+                'video_id': video_id,
+                'clips_count': clips_count,
+                'virality_score': video.virality_score
+            })
+
+            logger.info("  ✓ Generated %d clips", clips_count)
+        else:
+            logger.warning("  ✗ Processing failed: %s", list(outcome.errors))
+            enqueue(video_id, 'failed')
+            results['failures'] += 1
+
+    def _log_creation_summary(self, results: Dict[str, Any]) -> None:
+        """Log the Phase 2 results summary."""
+        if not self.verbose_summary:
+            _log_compact_summary('phase2', results)
+            return
+
+        logger.info("\n%s", _BANNER)
         logger.info("PHASE 2 COMPLETE: Creation Summary")
-        logger.info("="*60)
-        logger.info(f"Videos processed: {results['videos_processed']}")
-        logger.info(f"Total clips generated: {results['clips_generated']}")
-        logger.info(f"Failures: {results['failures']}")
+        logger.info(_BANNER)
+        logger.info("Videos processed: %d", results['videos_processed'])
+        logger.info("Total clips generated: %d", results['clips_generated'])
+        logger.info("Failures: %d", results['failures'])
 
         if results['published_videos']:
             logger.info("\nPublished videos:")
             for pub in results['published_videos']:
-                logger.info(f"  • {pub['video_id']} - {pub['clips_count']} clips (score: {pub['virality_score']:.1f})")
+                logger.info("  • %s - %d clips (score: %.1f)", pub['video_id'],
+                            pub['clips_count'], pub['virality_score'])
 
-        return results
+    def _phase2_worker(self, creation_queue: queue.Queue, results: Dict[str, Any]) -> None:
+        """
+        Consume videos queued by Phase 1 and run the creation pipeline on them.
+
+        Stops creating after max_videos_to_process videos but keeps draining
+        the queue until the None sentinel so the producer never blocks.
+
+        Args:
+            creation_queue: Queue of analyzed video rows, terminated by None
+            results: Phase 2 results summary to update
+        """
+        started = 0
+
+        with self._status_writer() as writer:
+            while True:
+                video = creation_queue.get()
+                if video is None:
+                    break
+                if started >= self.max_videos_to_process:
+                    continue
+
+                started += 1
+                # Queued videos were not claimed by claim_top_analyzed_batch
+                writer.enqueue(video.youtube_id, 'processing')
+                logger.info("\n[creation %d/%d] Processing video: %s (score %.1f)", started,
+                            self.max_videos_to_process, video.youtube_id, video.virality_score)
+                outcome = self._process_one_creation(video)
+                self._record_creation_outcome(video, outcome, results, writer.enqueue)
 
     def run_full_pipeline(self) -> Dict[str, Any]:
         """
@@ -239,9 +539,12 @@ class PipelineOrchestrator:
         Returns:
             Combined results from both phases
         """
-        logger.info("="*60)
+        if self.pipelined:
+            return self.run_pipelined()
+
+        logger.info(_BANNER)
         logger.info("RUNNING FULL PIPELINE")
-        logger.info("="*60)
+        logger.info(_BANNER)
 
         # Run Phase 1: Analysis
         phase1_results = self.run_phase_1_analysis()
@@ -266,17 +569,63 @@ class PipelineOrchestrator:
         }
 
         # Print final summary
-        logger.info("\n" + "="*60)
+        if not self.verbose_summary:
+            return combined_results
+
+        logger.info("\n%s", _BANNER)
         logger.info("FULL PIPELINE COMPLETE - Final Summary")
-        logger.info("="*60)
-        logger.info(f"Phase 1 - Analyzed: {phase1_results['videos_analyzed']} videos")
-        logger.info(f"Phase 1 - Above threshold: {phase1_results['videos_above_threshold']} videos")
-        logger.info(f"Phase 2 - Processed: {phase2_results['videos_processed']} videos")
-        logger.info(f"Phase 2 - Clips generated: {phase2_results['clips_generated']} clips")
-        logger.info(f"Phase 2 - Failures: {phase2_results['failures']}")
+        logger.info(_BANNER)
+        logger.info("Phase 1 - Analyzed: %s videos", phase1_results['videos_analyzed'])
+        logger.info("Phase 1 - Above threshold: %s videos", phase1_results['videos_above_threshold'])
+        logger.info("Phase 2 - Processed: %s videos", phase2_results['videos_processed'])
+        logger.info("Phase 2 - Clips generated: %s clips", phase2_results['clips_generated'])
+        logger.info("Phase 2 - Failures: %s", phase2_results['failures'])
 
         return combined_results
 
+    def run_pipelined(self) -> Dict[str, Any]:
+        """
+        Run Analysis and Creation concurrently as a producer/consumer pipeline.
+
+        Videos that clear the virality threshold are handed to a Phase 2
+        worker thread as soon as they are scored, so downloads overlap with
+        the remaining analyses. Phase 2 takes the first qualifying videos in
+        completion order rather than the global top scores.
+
+        Returns:
+            Combined results from both phases
+        """
+        logger.info(_BANNER)
+        logger.info("RUNNING PIPELINED ANALYSIS + CREATION")
+        logger.info(_BANNER)
+
+        # Bounded so analysis can't run far ahead of the downloads
+        creation_queue = queue.Queue(maxsize=self.max_videos_to_process * 2)
+        phase2_results = self._new_creation_results()
+        worker = threading.Thread(
+            target=self._phase2_worker,
+            args=(creation_queue, phase2_results),
+            name='phase2-creation'
+        )
+
+        # One writer for both phases keeps each video's status changes ordered
+        with self._status_writer():
+            worker.start()
+
+            try:
+                phase1_results = self.run_phase_1_analysis(creation_queue=creation_queue)
+            finally:
+                creation_queue.put(None)
+                worker.join()
+
+        self._log_creation_summary(phase2_results)
+
+        return {
+            'phase1': phase1_results,
+            'phase2': phase2_results,
+            'total_clips': phase2_results.get('clips_generated', 0)
+        }
+
 
 def main():
     """Test orchestrator."""
@@ -290,7 +639,7 @@ def main():
     # Run full pipeline
     logger.info("Running full pipeline test...")
     results = orchestrator.run_full_pipeline()
-    logger.info(f"Full pipeline results: {results}")
+    logger.info("Full pipeline results: %s", results)
 
 
 if __name__ == '__main__':
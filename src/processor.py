@@ -7,34 +7,130 @@ Coordinates all modules to process videos end-to-end.
 import os
 import sys
 import argparse
+import functools
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import json
 
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from downloader import VideoDownloader
-from transcriber import Transcriber
-from analyzer import ViralMomentDetector
-from editor import VideoEditor
+from editor import VideoEditor, clips_within_limits
 from caption_generator import CaptionGenerator
 from seo_generator import SEOGenerator
 from quality_assurance import QualityAssurance
-from database import Database
+from database import Database, VideoRow
+from utils import expand_clip
 
-# Import new 3-tier transcription modules
+# orjson writes large results files much faster; stdlib json is the fallback
 try:
-    from transcription_api import YouTubeCaptionFetcher
-    from stealth_downloader import StealthDownloader
-    TRANSCRIPTION_MODULES_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Transcription modules not available: {e}")
-    TRANSCRIPTION_MODULES_AVAILABLE = False
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_SUMMARY_RULE = "=" * 50
+
+# Whisper model used for Tier 2; stored transcripts from other models are ignored
+WHISPER_MODEL = 'base'
+
+# Phases a worker job may request
+WORKER_PHASES = ('analysis', 'creation')
+
+def _quantize(value: Optional[float], digits: int) -> Optional[float]:
+    """Round a float for results output, passing None through."""
+    return None if value is None else round(value, digits)
+
+def _resolve_metadata_batch(future: Future) -> Dict[int, Dict[str, Any]]:
+    """
+    Wait for a batch metadata request, returning an empty batch on failure.
+
+    Clips missing from the batch fall back to template metadata, so a
+    failed request never aborts the whole video.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        logger.warning("Batch metadata generation failed, using templates: %s", e)
+        return {}
+
+# Whisper (torch), Gemini, Playwright and the Google API client are slow to
+# import, so the modules wrapping them are imported on first use
+@functools.cache
+def _transcription_modules() -> Optional[Tuple[type, type]]:
+    """Import the 3-tier transcription modules (caption API, stealth download)."""
+    try:
+        from transcription_api import YouTubeCaptionFetcher
+        from stealth_downloader import StealthDownloader
+    except ImportError as e:
+        logger.warning("Transcription modules not available: %s", e)
+        return None
+    return YouTubeCaptionFetcher, StealthDownloader
+
+@dataclass(slots=True)
+class ProcessOutcome:
+    """Fields of a process_video result that the pipeline orchestrator acts on."""
+    video_id: Optional[str]
+    success: bool = False
+    virality_score: float = 0.0
+    clips_generated: tuple = ()
+    errors: tuple = ()
+
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> 'ProcessOutcome':
+        """Convert a process_video results dictionary."""
+        return cls(
+            video_id=result.get('video_id'),
+            success=bool(result.get('success')),
+            virality_score=result.get('virality_score', 0.0),
+            clips_generated=tuple(result.get('clips_generated', ())),
+            errors=tuple(result.get('errors', ()))
+        )
+
+@dataclass(slots=True)
+class ClipDraft:
+    """A generated clip waiting to be inserted into the clips table."""
+    youtube_id: str
+    clip_path: str
+    platform: str
+    start_time: float
+    end_time: float
+    moment_type: Optional[str]
+    quote: Optional[str]
+    virality_score: Optional[float]
+    title: str
+    description: str
+    hashtags: List[str]
+    qa_passed: bool = False
+
+    def validate(self) -> Optional[str]:
+        """
+        Check the draft can be saved.
+
+        Returns:
+            Description of the first problem found, or None if valid
+        """
+        if self.moment_type is None:
+            return "missing moment type"
+        if self.quote is None:
+            return "missing quote"
+        if self.virality_score is None:
+            return "missing virality score"
+        if self.end_time <= self.start_time:
+            return f"clip ends before it starts ({self.start_time}-{self.end_time})"
+        return None
+
+    def to_row(self) -> Dict[str, Any]:
+        """Convert to the dictionary accepted by Database.add_clips_bulk."""
+        return asdict(self)
+
 class VideoProcessor:
     """Process a video through the entire pipeline."""
 
@@ -49,32 +145,121 @@ class VideoProcessor:
         self.db = Database()
 
         # Initialize components
-        self.downloader = VideoDownloader()
         self.transcriber = None  # Lazy load
         self.detector = None  # Lazy load
-        self.editor = VideoEditor()
         self.caption_gen = CaptionGenerator(style='gaming')
         self.seo_gen = SEOGenerator()
         self.qa = QualityAssurance(strictness='strict')
 
+        # Download, encoding and transcription settings
+        video_processing = self.config.get('video_processing', {})
+        self.downloader = VideoDownloader(
+            concurrent_fragments=video_processing.get('concurrent_fragments', 8)
+        )
+        self.editor = VideoEditor(hwaccel=video_processing.get('hwaccel_decode'))
+        self.parallel_encode = video_processing.get('parallel_encode', True)
+        self.encode_workers = video_processing.get('encode_workers') or os.cpu_count() or 1
+        self.whisper_compute_type = video_processing.get('whisper_compute_type', 'float16')
+        self.whisper_device_index = video_processing.get('whisper_device_index')
+
+        # Guard lazy initialization when videos are analyzed concurrently.
+        # One lock per component, so a Whisper model load does not hold up
+        # detector setup or captions API calls on other workers.
+        self._transcriber_lock = threading.Lock()
+        self._detector_lock = threading.Lock()
+        self._client_lock = threading.Lock()
+
     def _get_transcriber(self):
         """Lazy load transcriber."""
-        if self.transcriber is None:
-            try:
-                self.transcriber = Transcriber(model_size='base')
-            except Exception as e:
-                logger.warning(f"Could not initialize transcriber: {e}")
+        with self._transcriber_lock:
+            if self.transcriber is None:
+                try:
+                    from transcriber import Transcriber
+                    self.transcriber = Transcriber(model_size=WHISPER_MODEL,
+                                                   compute_type=self.whisper_compute_type,
+                                                   device_index=self.whisper_device_index)
+                except Exception as e:
+                    logger.warning("Could not initialize transcriber: %s", e)
         return self.transcriber
 
     def _get_detector(self):
         """Lazy load detector."""
-        if self.detector is None:
-            try:
-                self.detector = ViralMomentDetector()
-            except Exception as e:
-                logger.warning(f"Could not initialize detector: {e}")
+        with self._detector_lock:
+            if self.detector is None:
+                try:
+                    from analyzer import ViralMomentDetector
+                    self.detector = ViralMomentDetector()
+                except Exception as e:
+                    logger.warning("Could not initialize detector: %s", e)
         return self.detector
 
+    def warm_up(self) -> None:
+        """
+        Load the Whisper model, Gemini detector and transcription modules now.
+
+        Long-lived processors call this once at startup so the first video
+        does not pay for model loading.
+        """
+        _transcription_modules()
+        self._get_transcriber()
+        self._get_detector()
+
+    def _encode_clips(self, video_path: str,
+                      pairs: List[Tuple[Dict[str, Any], str]]) -> Iterator[Tuple[int, Optional[str], Optional[Exception]]]:
+        """
+        Encode one clip per (moment, platform) pair.
+
+        Each moment is encoded for all of its platforms in one ffmpeg run.
+        With parallel_encode, moments are encoded concurrently and results
+        are yielded as they finish; the caller stays on one thread, so
+        metadata, QA and database writes remain serial.
+
+        Args:
+            video_path: Path to the downloaded source video
+            pairs: (moment, platform) pairs to encode
+
+        Returns:
+            Iterator of (pair index, clip path or None, exception or None)
+        """
+        # Group pair indices by moment, keeping first-seen order
+        groups = {}
+        for i, (moment, platform) in enumerate(pairs):
+            groups.setdefault(id(moment), (moment, []))[1].append((i, platform))
+
+        def encode(moment: Dict[str, Any], items: List[Tuple[int, str]]) -> Dict[str, Optional[str]]:
+            return self.editor.process_clip_for_all_platforms(
+                video_path,
+                moment['start'],
+                moment['end'],
+                [platform for _, platform in items]
+            )
+
+        if not self.parallel_encode or len(groups) < 2:
+            for moment, items in groups.values():
+                try:
+                    paths = encode(moment, items)
+                except Exception as e:
+                    for i, _ in items:
+                        yield i, None, e
+                    continue
+                for i, platform in items:
+                    yield i, paths.get(platform), None
+            return
+
+        workers = min(self.encode_workers, len(groups))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='encode') as executor:
+            futures = {executor.submit(encode, *group): group[1] for group in groups.values()}
+            for future in as_completed(futures):
+                items = futures[future]
+                try:
+                    paths = future.result()
+                except Exception as e:
+                    for i, _ in items:
+                        yield i, None, e
+                    continue
+                for i, platform in items:
+                    yield i, paths.get(platform), None
+
     def _get_transcription(self, video_id: str, video_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get transcription using 3-tier fallback strategy.
@@ -90,25 +275,34 @@ class VideoProcessor:
         Returns:
             Transcription dict with source tracking or None
         """
-        if not TRANSCRIPTION_MODULES_AVAILABLE:
+        stored = self.db.get_transcript(video_id, WHISPER_MODEL)
+        if stored is not None:
+            logger.info("✓ Using stored transcript for %s", video_id)
+            return stored
+
+        modules = _transcription_modules()
+        if modules is None:
             logger.warning("Transcription modules not available, skipping transcription")
             return None
+        YouTubeCaptionFetcher, StealthDownloader = modules
             
         # Tier 1: YouTube Captions API
         logger.info("🎯 Tier 1: Attempting YouTube Captions API...")
         try:
-            if not hasattr(self, '_caption_fetcher'):
-                youtube_api_key = os.getenv('YOUTUBE_API_KEY')
-                if not youtube_api_key:
-                    logger.warning("YOUTUBE_API_KEY not available for Tier 1")
-                    raise ValueError("YOUTUBE_API_KEY not available")
-                
-                self._caption_fetcher = YouTubeCaptionFetcher(youtube_api_key)
+            with self._client_lock:
+                if not hasattr(self, '_caption_fetcher'):
+                    youtube_api_key = os.getenv('YOUTUBE_API_KEY')
+                    if not youtube_api_key:
+                        logger.warning("YOUTUBE_API_KEY not available for Tier 1")
+                        raise ValueError("YOUTUBE_API_KEY not available")
+
+                    self._caption_fetcher = YouTubeCaptionFetcher(youtube_api_key)
             
             transcription = self._caption_fetcher.fetch_captions(video_id)
             if transcription:
                 logger.info("✅ Tier 1 SUCCESS: YouTube Captions API")
                 transcription['transcription_source'] = 'youtube_captions'
+                self.db.save_transcript(video_id, transcription)
                 return transcription
             else:
                 logger.info("⚠️  Tier 1: No captions available via API")
@@ -116,9 +310,9 @@ class VideoProcessor:
         except ImportError:
             logger.warning("⚠️  Tier 1: YouTube API client not installed")
         except ValueError as e:
-            logger.warning(f"⚠️  Tier 1: {e}")
+            logger.warning("⚠️  Tier 1: %s", e)
         except Exception as e:
-            logger.warning(f"⚠️  Tier 1 failed: {e}")
+            logger.warning("⚠️  Tier 1 failed: %s", e)
         
         # Tier 2: Stealth Browser Download
         logger.info("🎯 Tier 2: Attempting Stealth Browser Download...")
@@ -131,8 +325,10 @@ class VideoProcessor:
                     logger.error("❌ Tier 2: Failed to download video")
                     raise Exception("Download failed")
             
-            # Initialize stealth downloader
-            stealth_downloader = StealthDownloader(output_dir='data/downloads')
+            # Initialize stealth downloader once per processor
+            with self._client_lock:
+                if not hasattr(self, '_stealth_downloader'):
+                    self._stealth_downloader = StealthDownloader(output_dir='data/downloads')
             
             # The stealth downloader downloads the video, but we already have it
             # So we use the transcriber with Whisper on the downloaded video
@@ -142,6 +338,7 @@ class VideoProcessor:
                 if transcription:
                     logger.info("✅ Tier 2 SUCCESS: Stealth Download + Whisper")
                     transcription['transcription_source'] = 'stealth_playwright'
+                    self.db.save_transcript(video_id, transcription, WHISPER_MODEL)
                     return transcription
             
             # Clean up downloaded video if we created it
@@ -151,30 +348,67 @@ class VideoProcessor:
         except ImportError:
             logger.warning("⚠️  Tier 2: Playwright not installed")
         except Exception as e:
-            logger.warning(f"⚠️  Tier 2 failed: {e}")
+            logger.warning("⚠️  Tier 2 failed: %s", e)
         
         # Tier 3: Graceful Failure
-        logger.error(f"❌ All transcription tiers failed for {video_id}")
+        logger.error("❌ All transcription tiers failed for %s", video_id)
         logger.info("🔄 Tier 3: Graceful failure - continuing pipeline without transcription")
         
         return None
 
-    def process_video(self, video_id: str, niche: str = 'gaming', phase: str = 'creation') -> Dict[str, Any]:
+    def _detect_moments(self, detector, video_id: str,
+                        transcription: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        Process a video through the pipeline.
+        Detect viral moments, reusing ones stored for this detector version.
 
         Args:
+            detector: ViralMomentDetector instance
             video_id: YouTube video ID
-            niche: Game niche/category
+            transcription: Transcription dict
+
+        Returns:
+            Scored moments, best first
+        """
+        moments = self.db.get_moments(video_id, detector.version)
+        if moments is not None:
+            logger.info("✓ Using stored moments for %s", video_id)
+            return moments
+
+        moments, complete = detector.detect_moments(transcription)
+        # A failed Gemini request leaves moments missing, so only complete
+        # detections are stored; the next run retries the rest
+        if complete:
+            self.db.save_moments(video_id, detector.version, moments)
+        return moments
+
+    def process_video(self, video_id: Optional[str] = None, niche: Optional[str] = None,
+                      phase: str = 'creation',
+                      video: Optional[VideoRow] = None,
+                      video_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Process a video through the pipeline.
+
+        Args:
+            video_id: YouTube video ID (taken from ``video`` when omitted)
+            niche: Game niche/category (taken from ``video`` when omitted)
             phase: 'analysis' for transcript+analyze only, 'creation' for full pipeline
+            video: Pre-fetched video row from the database, so callers that
+                already hold the row don't trigger another lookup
+            video_path: Already downloaded source video (creation phase only);
+                it is still cleaned up when processing ends
 
         Returns:
             Processing results
         """
+        if video is not None:
+            video_id = video_id or video.youtube_id
+            niche = niche or video.niche
+        niche = niche or 'gaming'
+
         if phase == 'analysis':
             return self._process_analysis_phase(video_id, niche)
         else:
-            return self._process_creation_phase(video_id, niche)
+            return self._process_creation_phase(video_id, niche, video_path)
 
     def _process_analysis_phase(self, video_id: str, niche: str = 'gaming') -> Dict[str, Any]:
         """
@@ -187,7 +421,7 @@ class VideoProcessor:
         Returns:
             Analysis results with virality score
         """
-        logger.info(f"=== ANALYSIS PHASE: {video_id} ===")
+        logger.info("=== ANALYSIS PHASE: %s ===", video_id)
         results = {
             'video_id': video_id,
             'niche': niche,
@@ -200,6 +434,12 @@ class VideoProcessor:
         }
 
         try:
+            # Initialize the detector while the transcript is being fetched;
+            # Step 2 picks it up (or waits on its lock) when it is needed
+            if self.detector is None:
+                threading.Thread(target=self._get_detector, name='detector-init',
+                                 daemon=True).start()
+
             # Step 1: Get transcription using 3-tier fallback strategy
             logger.info("Step 1: Getting transcription...")
             transcription = self._get_transcription(video_id)
@@ -210,7 +450,7 @@ class VideoProcessor:
                 return results
             
             results['transcription_source'] = transcription.get('transcription_source')
-            logger.info(f"✓ Transcription via {results['transcription_source']}")
+            logger.info("✓ Transcription via %s", results['transcription_source'])
 
             # Step 2: Detect viral moments
             logger.info("Step 2: Analyzing transcript for viral moments...")
@@ -218,7 +458,7 @@ class VideoProcessor:
             moments = []
 
             if detector and transcription:
-                moments = detector.analyze_transcript(transcription)
+                moments = self._detect_moments(detector, video_id, transcription)
                 # Select best moments
                 best_moments = detector.select_best_moments(moments, count=3, min_score=70)
                 
@@ -229,8 +469,8 @@ class VideoProcessor:
                     results['moments_found'] = len(best_moments)
                     results['success'] = True
                     
-                    logger.info(f"✓ Found {len(best_moments)} viral moments")
-                    logger.info(f"✓ Average virality score: {avg_score:.1f}")
+                    logger.info("✓ Found %s viral moments", len(best_moments))
+                    logger.info("✓ Average virality score: %.1f", avg_score)
                 else:
                     logger.warning("No viral moments above threshold")
                     results['errors'].append("No viral moments detected")
@@ -241,35 +481,41 @@ class VideoProcessor:
             return results
 
         except Exception as e:
-            logger.error(f"Error in analysis phase: {e}", exc_info=True)
+            logger.error("Error in analysis phase: %s", e, exc_info=True)
             results['errors'].append(f"Analysis error: {str(e)}")
             return results
 
-    def _process_creation_phase(self, video_id: str, niche: str = 'gaming') -> Dict[str, Any]:
+    def _process_creation_phase(self, video_id: str, niche: str = 'gaming',
+                                video_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Phase 2: Full pipeline with download and clip creation.
 
         Args:
             video_id: YouTube video ID
             niche: Game niche/category
+            video_path: Already downloaded source video, or None to download it
 
         Returns:
             Processing results
         """
-        logger.info(f"=== CREATION PHASE: {video_id} ===")
+        logger.info("=== CREATION PHASE: %s ===", video_id)
         results = {
             'video_id': video_id,
             'niche': niche,
             'phase': 'creation',
             'success': False,
+            'moments': [],
             'clips_generated': [],
             'transcription_source': None,  # NEW: Track which tier succeeded
             'errors': []
         }
 
         # Step 1: Download video
-        logger.info("Step 1: Downloading video...")
-        video_path = self.downloader.download(video_id)
+        if video_path and os.path.exists(video_path):
+            logger.info("Step 1: Using prefetched download")
+        else:
+            logger.info("Step 1: Downloading video...")
+            video_path = self.downloader.download(video_id)
         if not video_path:
             results['errors'].append("Failed to download video")
             return results
@@ -285,7 +531,7 @@ class VideoProcessor:
                 return results
             
             results['transcription_source'] = transcription.get('transcription_source')
-            logger.info(f"✓ Transcription via {results['transcription_source']}")
+            logger.info("✓ Transcription via %s", results['transcription_source'])
 
             # Step 3: Detect viral moments
             logger.info("Step 3: Detecting viral moments...")
@@ -293,7 +539,7 @@ class VideoProcessor:
             moments = []
 
             if detector and transcription:
-                moments = detector.analyze_transcript(transcription)
+                moments = self._detect_moments(detector, video_id, transcription)
                 # Select best moments
                 moments = detector.select_best_moments(moments, count=3, min_score=70)
 
@@ -302,78 +548,110 @@ class VideoProcessor:
                 results['errors'].append("No viral moments detected")
                 return results
 
-            logger.info(f"Found {len(moments)} viral moments")
+            logger.info("Found %s viral moments", len(moments))
 
             # Step 4: Generate clips
             logger.info("Step 4: Generating clips...")
             platforms = ['youtube_shorts', 'tiktok', 'instagram_reels']
 
-            for moment in moments:
-                for platform in platforms:
-                    try:
-                        # Extract and convert clip
-                        clip_path = self.editor.process_clip_for_platform(
-                            video_path,
-                            moment['start'],
-                            moment['end'],
-                            platform
-                        )
-
-                        if clip_path:
-                            # Generate metadata
-                            metadata = self.seo_gen.generate_metadata(moment, niche, platform)
-
-                            # QA check
-                            qa_result = self.qa.check_clip({
-                                'clip_path': clip_path,
-                                'quote': moment.get('quote', ''),
-                                'duration': moment['end'] - moment['start'],
-                                'platform': platform
-                            })
-
-                            # Save to database
-                            clip_data = {
-                                'youtube_id': video_id,
-                                'clip_path': clip_path,
-                                'platform': platform,
-                                'start_time': moment['start'],
-                                'end_time': moment['end'],
-                                'moment_type': moment['type'],
-                                'quote': moment['quote'],
-                                'virality_score': moment['virality_score'],
-                                'title': metadata['title'],
-                                'description': metadata['description'],
-                                'hashtags': metadata['hashtags'],
-                                'qa_passed': qa_result['passed']
-                            }
-
-                            clip_id = self.db.add_clip(clip_data)
-
-                            results['clips_generated'].append({
-                                'platform': platform,
-                                'clip_path': clip_path,
-                                'clip_id': clip_id,
-                                'qa_passed': qa_result['passed'],
-                                'qa_score': qa_result.get('overall_score', 0),
-                                'virality_score': moment['virality_score']
-                            })
-
-                            logger.info(f"✓ Generated {platform} clip (QA: {qa_result['passed']})")
-
-                    except Exception as e:
-                        logger.error(f"Error processing moment for {platform}: {e}")
-                        results['errors'].append(f"{platform}: {str(e)}")
+            # Skip combinations longer than the platform allows, then fetch
+            # all metadata in one batch instead of one request per clip. The
+            # request runs in the background while the first clip encodes and
+            # is only waited on once that clip needs its metadata.
+            pairs = clips_within_limits(moments, platforms)
+            seo_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='seo')
+            metadata_future = seo_executor.submit(self.seo_gen.generate_metadata_batch, pairs, niche)
+            seo_executor.shutdown(wait=False)
+
+            # Moment details are stored once; clips refer to them by index.
+            # Times keep centiseconds and scores one decimal in the output.
+            results['moments'] = [
+                {
+                    'start_time': _quantize(moment['start'], 2),
+                    'end_time': _quantize(moment['end'], 2),
+                    'moment_type': moment.get('type'),
+                    'quote': moment.get('quote'),
+                    'virality_score': _quantize(moment.get('virality_score'), 1)
+                }
+                for moment in moments
+            ]
+            moment_index = {id(moment): i for i, moment in enumerate(moments)}
+            # Clip rows are inserted together once encoding finishes
+            pending_clips = []
+
+            metadata_batch = None
+
+            for i, clip_path, encode_error in self._encode_clips(video_path, pairs):
+                moment, platform = pairs[i]
+                if encode_error is not None:
+                    logger.error("Error processing moment for %s: %s", platform, encode_error)
+                    results['errors'].append(f"{platform}: {encode_error}")
+                    continue
+
+                if not clip_path:
+                    continue
+
+                if metadata_batch is None:
+                    metadata_batch = _resolve_metadata_batch(metadata_future)
+                metadata = metadata_batch.get(i)
+                if metadata is None:
+                    metadata = self.seo_gen.generate_template_metadata(moment, niche, platform)
+                draft = ClipDraft(
+                    youtube_id=video_id,
+                    clip_path=clip_path,
+                    platform=platform,
+                    start_time=moment['start'],
+                    end_time=moment['end'],
+                    moment_type=moment.get('type'),
+                    quote=moment.get('quote'),
+                    virality_score=moment.get('virality_score'),
+                    title=metadata['title'],
+                    description=metadata['description'],
+                    hashtags=metadata['hashtags']
+                )
+
+                problem = draft.validate()
+                if problem:
+                    logger.error("Skipping %s clip: %s", platform, problem)
+                    results['errors'].append(f"{platform}: {problem}")
+                    continue
+
+                # QA check
+                qa_result = self.qa.check_clip({
+                    'clip_path': clip_path,
+                    'quote': draft.quote,
+                    'duration': draft.end_time - draft.start_time,
+                    'platform': platform
+                })
+                draft.qa_passed = qa_result['passed']
+
+                pending_clips.append(draft)
+
+                results['clips_generated'].append({
+                    'moment': moment_index[id(moment)],
+                    'platform': platform,
+                    'clip_path': clip_path,
+                    'clip_id': None,
+                    'qa_passed': qa_result['passed'],
+                    'qa_score': _quantize(qa_result.get('overall_score', 0), 1)
+                })
+
+                logger.info("✓ Generated %s clip (QA: %s)", platform, qa_result['passed'])
+
+            clip_ids = self.db.add_clips_bulk([draft.to_row() for draft in pending_clips])
+            for clip, clip_id in zip(results['clips_generated'], clip_ids):
+                clip['clip_id'] = clip_id
 
             # Step 5: Mark video as processed
             self.db.mark_video_processed(video_id)
 
             results['success'] = True
-            logger.info(f"=== Processing complete: {len(results['clips_generated'])} clips generated ===")
+            logger.info("=== Processing complete: %s clips generated ===", len(results['clips_generated']))
 
             return results
 
         except Exception as e:
-            logger.error(f"Error processing video: {e}", exc_info=True)
+            logger.error("Error processing video: %s", e, exc_info=True)
             results['errors'].append(f"Processing error: {str(e)}")
             return results
 
@@ -382,14 +660,79 @@ class VideoProcessor:
             if video_path and os.path.exists(video_path):
                 self.downloader.cleanup(video_path)
 
+def _results_json(results: Dict[str, Any], indent: bool = False) -> bytes:
+    """Serialize a results dictionary to UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        # NumPy scalars (e.g. from vectorized clip filtering) serialize as
+        # numbers natively instead of falling through to default=str
+        option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                  | (orjson.OPT_INDENT_2 if indent else 0))
+        return orjson.dumps(results, default=str, option=option)
+    return json.dumps(results, indent=2 if indent else None, default=str).encode()
+
+def _write_results(output_path: str, results: Dict[str, Any]) -> None:
+    """Write a results dictionary to disk as indented JSON."""
+    with open(output_path, 'wb') as f:
+        f.write(_results_json(results, indent=True))
+
+def run_worker(config: Dict[str, Any]) -> None:
+    """
+    Process newline-delimited JSON jobs from stdin in one resident process.
+
+    Each job line is {"video_id": ..., "niche": ..., "phase": ...}; one
+    results line is written to stdout per job, in order. Lets an outer
+    scheduler pay interpreter, import and config startup once per batch
+    instead of once per video.
+
+    stdout is reserved for results: file descriptor 1 is pointed at stderr
+    so yt-dlp, ffmpeg and stray prints cannot corrupt the results stream.
+
+    Args:
+        config: Configuration dictionary
+    """
+    sys.stdout.flush()
+    out = os.fdopen(os.dup(sys.stdout.fileno()), 'wb')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    processor = VideoProcessor(config)
+    processor.warm_up()
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+
+        try:
+            job = loads(line)
+            video_id = job['video_id']
+            phase = job.get('phase', 'creation')
+            if phase not in WORKER_PHASES:
+                raise ValueError(f"unknown phase {phase!r}")
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error("Invalid worker job %r: %s", line[:200], e)
+            results = {'video_id': None, 'success': False, 'errors': [f"Invalid job: {e}"]}
+        else:
+            results = processor.process_video(video_id, job.get('niche'), phase=phase)
+
+        out.write(_results_json(results) + b'\n')
+        out.flush()
+
 def main():
     """Main entry point for video processing."""
+    # Worker mode (YTCLIP_WORKER=1): jobs arrive on stdin, no CLI arguments
+    if os.getenv('YTCLIP_WORKER'):
+        from config_validator import ConfigValidator
+        run_worker(ConfigValidator().get_config() or {})
+        return
+
     parser = argparse.ArgumentParser(description='Process videos through two-phase pipeline')
     parser.add_argument('--phase', choices=['analysis', 'creation'], 
                        help='Pipeline phase to run (analysis or creation)')
     parser.add_argument('--video-id', help='YouTube video ID (for single video mode)')
     parser.add_argument('--niche', default='gaming', help='Game niche/category')
     parser.add_argument('--output', help='Output JSON file for results')
+    parser.add_argument('--compute-type', choices=['float32', 'float16', 'int8_float16', 'int8'],
+                       help='Whisper compute type (overrides video_processing.whisper_compute_type)')
 
     args = parser.parse_args()
 
@@ -397,6 +740,8 @@ def main():
     from config_validator import ConfigValidator
     validator = ConfigValidator()
     config = validator.get_config() or {}
+    if args.compute_type:
+        config.setdefault('video_processing', {})['whisper_compute_type'] = args.compute_type
 
     # Determine mode
     if args.phase:
@@ -416,10 +761,9 @@ def main():
         os.makedirs('data', exist_ok=True)
         output_path = args.output or f"data/phase_{args.phase}_results.json"
         
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        _write_results(output_path, results)
         
-        logger.info(f"Results saved to: {output_path}")
+        logger.info("Results saved to: %s", output_path)
         
         # Exit with success if any videos were processed
         success = results.get('videos_analyzed', 0) > 0 or results.get('videos_processed', 0) > 0
@@ -439,15 +783,14 @@ def main():
         else:
             output_path = f"data/process_results_{args.video_id}.json"
 
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        _write_results(output_path, results)
 
-        logger.info(f"Results saved to: {output_path}")
+        logger.info("Results saved to: %s", output_path)
 
         # Print summary
-        print(f"\n{'='*50}")
+        print(f"\n{_SUMMARY_RULE}")
         print(f"Processing Summary for {args.video_id}")
-        print(f"{'='*50}")
+        print(_SUMMARY_RULE)
         print(f"Success: {results['success']}")
         print(f"Clips generated: {len(results.get('clips_generated', []))}")
         print(f"Errors: {len(results.get('errors', []))}")
@@ -460,6 +803,7 @@ def main():
         if results.get('clips_generated'):
             print(f"\nClips:")
             for clip in results['clips_generated']:
+                clip = expand_clip(clip, results.get('moments', []))
                 status = "✓" if clip.get('qa_passed') else "✗"
                 print(f"  {status} {clip['platform']}: {clip['clip_path']}")
                 print(f"      Virality: {clip.get('virality_score', 0)}, QA: {clip.get('qa_score', 0)}")
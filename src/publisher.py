@@ -5,47 +5,123 @@ Selects and publishes only the highest earning potential clip per run.
 """
 
 import os
+import re
 import sys
 import json
+import time
+import asyncio
 import logging
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-import time
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from earning_calculator import EarningCalculator
+from utils import ensure_dir, expand_clip
 from publishers.youtube import YouTubePublisher
 from publishers.tiktok import TikTokPublisher
 from publishers.instagram import InstagramPublisher
 
+# orjson reads result files and the state file much faster; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 60
+
+# Minimum seconds between two uploads to the same platform; each platform's
+# API already throttles its own clients, so no extra gap is enforced by default
+PLATFORM_MIN_INTERVAL_SECONDS = {'youtube': 0, 'tiktok': 0, 'instagram': 0}
+
+# State retention: published entries kept for dedup, days of daily counts kept
+PUBLISHED_VIDEOS_LIMIT = 10000
+DAILY_COUNT_DAYS = 90
+
+def _read_json(path: str) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _write_json(path: str, data: Any) -> None:
+    """Atomically write data to a file as indented JSON."""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, default=str,
+                               option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, default=str).encode()
+
+    # Write beside the target and swap it in, so a crash never leaves a
+    # truncated file behind
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+# Brand safety keyword scanners, matched as substrings of the lowered text
+_PROFANITY_RE = re.compile('damn|hell|shit|fuck|ass|bitch')
+_VIOLENCE_RE = re.compile('kill|death|murder|violence')
+_EXPLICIT_RE = re.compile('sex|nude|explicit')
+
 class SmartPublisher:
     """Intelligent publisher that selects best earning potential video."""
 
-    def __init__(self, state_file: str = 'data/publishing_state.json'):
+    def __init__(self, state_file: str = 'data/publishing_state.json',
+                 init_publishers: bool = True):
         """
         Initialize smart publisher.
 
         Args:
             state_file: Path to state tracking file
+            init_publishers: Create platform publishers now; when False they
+                are created on first publish (dry runs never need them)
         """
         self.state_file = state_file
         self.earning_calculator = EarningCalculator()
+        self._earning_cache: Dict[str, Dict[str, Any]] = {}
+        # Brand safety by (quote, moment_type); platforms of a moment share both
+        self._safety_cache: Dict[Tuple[str, str], Dict[str, bool]] = {}
+        # Files seen by the last clips directory scan, to skip per-clip stats
+        self._known_clip_files: Set[str] = set()
+        # Parsed clips per result file with the (mtime_ns, size) they were read at
+        self._result_cache: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+        # Whether self.state has changes that _save_state has not written
+        self._state_dirty = False
+        # Monotonic time each platform's last upload finished
+        self._last_publish_at: Dict[str, float] = {}
         self.state = self._load_state()
 
+        # Published ids for O(1) duplicate checks, kept in sync by _update_state
+        published_videos = self.state.get('published_videos', [])
+        self._published_clip_ids = {p.get('clip_id') for p in published_videos}
+        self._published_youtube_ids = {p.get('youtube_id') for p in published_videos}
+
         # Load config to get daily limit
         self.daily_limit = self._load_daily_limit()
 
         # Initialize platform publishers
-        self.publishers = self._initialize_publishers()
+        self.publishers: Dict[str, Any] = {}
+        self._publishers_initialized = False
+        if init_publishers:
+            self._ensure_publishers()
 
         logger.info("Initialized SmartPublisher")
 
+    def _ensure_publishers(self):
+        """Create the platform publishers once, on first need."""
+        if not self._publishers_initialized:
+            self.publishers = self._initialize_publishers()
+            self._publishers_initialized = True
+
     def _initialize_publishers(self) -> Dict[str, Any]:
         """Initialize platform publishers."""
         publishers = {}
@@ -54,19 +130,19 @@ class SmartPublisher:
             publishers['youtube'] = YouTubePublisher()
             logger.info("✓ YouTube publisher initialized")
         except Exception as e:
-            logger.warning(f"Could not initialize YouTube publisher: {e}")
+            logger.warning("Could not initialize YouTube publisher: %s", e)
         
         try:
             publishers['tiktok'] = TikTokPublisher()
             logger.info("✓ TikTok publisher initialized")
         except Exception as e:
-            logger.warning(f"Could not initialize TikTok publisher: {e}")
+            logger.warning("Could not initialize TikTok publisher: %s", e)
         
         try:
             publishers['instagram'] = InstagramPublisher()
             logger.info("✓ Instagram publisher initialized")
         except Exception as e:
-            logger.warning(f"Could not initialize Instagram publisher: {e}")
+            logger.warning("Could not initialize Instagram publisher: %s", e)
         
         return publishers
 
@@ -74,12 +150,17 @@ class SmartPublisher:
         """Load publishing state to avoid duplicate uploads."""
         if os.path.exists(self.state_file):
             try:
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
-                logger.info(f"Loaded state: {len(state.get('published_videos', []))} previously published")
+                state = _read_json(self.state_file)
+                published_videos = state.get('published_videos', [])
+                logger.info("Loaded state: %s previously published", len(published_videos))
+
+                # Files written before the retention cap may hold more history
+                # than dedup needs; trim on load so memory and the id sets stay bounded
+                if len(published_videos) > PUBLISHED_VIDEOS_LIMIT:
+                    state['published_videos'] = published_videos[-PUBLISHED_VIDEOS_LIMIT:]
                 return state
             except Exception as e:
-                logger.warning(f"Could not load state file: {e}")
+                logger.warning("Could not load state file: %s", e)
 
         # Default state
         return {
@@ -102,13 +183,13 @@ class SmartPublisher:
                     config = yaml.safe_load(f)
 
                 daily_limit = config.get('publishing', {}).get('daily_limit', 3)
-                logger.info(f"Loaded daily_limit from config: {daily_limit}")
+                logger.info("Loaded daily_limit from config: %s", daily_limit)
                 return daily_limit
             else:
-                logger.warning(f"Config file not found at {config_path}, using default daily_limit: 3")
+                logger.warning("Config file not found at %s, using default daily_limit: 3", config_path)
                 return 3
         except Exception as e:
-            logger.warning(f"Could not load daily_limit from config: {e}, using default: 3")
+            logger.warning("Could not load daily_limit from config: %s, using default: 3", e)
             return 3
 
     def _check_daily_limit(self) -> bool:
@@ -116,56 +197,88 @@ class SmartPublisher:
         today = datetime.now().strftime('%Y-%m-%d')
         published_today = self.state.get('daily_count', {}).get(today, 0)
 
-        logger.info(f"Daily limit check: {published_today}/{self.daily_limit} published today")
+        logger.info("Daily limit check: %s/%s published today", published_today, self.daily_limit)
 
         if published_today >= self.daily_limit:
-            logger.warning(f"Daily limit of {self.daily_limit} already reached. Skipping publishing.")
+            logger.warning("Daily limit of %s already reached. Skipping publishing.", self.daily_limit)
             return False
 
         return True
 
     def _save_state(self):
-        """Save current publishing state."""
+        """Save current publishing state if it changed since the last save."""
+        if not self._state_dirty:
+            logger.debug("State unchanged, skipping save")
+            return
+
         self.state['last_updated'] = datetime.now().isoformat()
         
         try:
-            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
+            ensure_dir(os.path.dirname(self.state_file))
+            _write_json(self.state_file, self.state)
+            self._state_dirty = False
             logger.info("✓ State saved successfully")
         except Exception as e:
-            logger.error(f"Failed to save state: {e}")
+            logger.error("Failed to save state: %s", e)
 
-    def _load_clip_data(self, clips_dir: str = 'data/clips') -> List[Dict[str, Any]]:
-        """Load all available clip data from processing results."""
-        if not os.path.exists(clips_dir):
-            logger.warning(f"Clips directory {clips_dir} not found")
-            return []
-        
+    def _load_clip_data(self, clips_dir: str = 'data/clips', num_workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        Load all available clip data from processing results.
+
+        Result files are read and parsed on num_workers threads; clips are
+        returned in result file order. Files unchanged since the previous
+        call (same mtime and size) reuse their parsed clips.
+        """
         clips = []
         
-        # Look for processing result files
-        result_files = glob.glob(os.path.join(clips_dir, '*_result.json'))
+        # Look for processing result files in a single directory scan; the
+        # same listing tells _apply_filters which clip files exist
+        result_stats = {}
+        try:
+            with os.scandir(clips_dir) as entries:
+                known_files = set()
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    known_files.add(entry.path)
+                    if entry.name.endswith('_result.json'):
+                        stat = entry.stat()
+                        result_stats[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            logger.warning("Clips directory %s not found", clips_dir)
+            return []
+        self._known_clip_files = known_files
+        result_files = sorted(result_stats)
         
         if not result_files:
             logger.warning("No processing result files found")
             return []
         
-        for result_file in result_files:
+        def load(result_file: str) -> List[Dict[str, Any]]:
+            signature = result_stats[result_file]
+            cached = self._result_cache.get(result_file)
+            if cached and cached[0] == signature:
+                return [dict(clip) for clip in cached[1]]
+
             try:
-                with open(result_file, 'r') as f:
-                    result_data = json.load(f)
+                result_data = _read_json(result_file)
                 
                 # Extract clip information
                 video_clips = self._extract_clips_from_result(result_data)
-                clips.extend(video_clips)
-                
-                logger.debug(f"Loaded {len(video_clips)} clips from {result_file}")
+                logger.debug("Loaded %s clips from %s", len(video_clips), result_file)
+                self._result_cache[result_file] = (signature, [dict(clip) for clip in video_clips])
+                return video_clips
                 
             except Exception as e:
-                logger.error(f"Error loading {result_file}: {e}")
+                logger.error("Error loading %s: %s", result_file, e)
+                return []
+
+        workers = max(1, min(num_workers, len(result_files)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='load') as executor:
+            for video_clips in executor.map(load, result_files):
+                clips.extend(video_clips)
         
-        logger.info(f"Loaded {len(clips)} total clips for evaluation")
+        logger.info("Loaded %s total clips for evaluation", len(clips))
         return clips
 
     def _extract_clips_from_result(self, result_data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -177,40 +290,49 @@ class SmartPublisher:
         
         video_id = result_data.get('video_id', 'unknown')
         niche = result_data.get('niche', 'gaming')
+        processed_at = datetime.now().isoformat()
         
+        moments = result_data.get('moments', [])
         for clip_info in result_data['clips_generated']:
+            clip_info = expand_clip(clip_info, moments)
+            get = clip_info.get
+
             # Skip clips that didn't pass QA
-            if not clip_info.get('qa_passed', False):
-                logger.debug(f"Skipping clip {clip_info.get('clip_id')} - failed QA")
+            if not get('qa_passed', False):
+                logger.debug("Skipping clip %s - failed QA", get('clip_id'))
                 continue
+
+            platform = clip_info['platform']
+            # Engagement estimates assume a neutral 50 when the score is missing
+            engagement_base = get('virality_score', 50)
             
             clip_data = {
-                'clip_id': clip_info.get('clip_id', f"{video_id}_{clip_info['platform']}"),
+                'clip_id': get('clip_id', f"{video_id}_{platform}"),
                 'youtube_id': video_id,
                 'niche': niche,
-                'platform': clip_info['platform'],
+                'platform': platform,
                 'clip_path': clip_info['clip_path'],
-                'virality_score': clip_info.get('virality_score', 0),
-                'start_time': clip_info.get('start_time', 0),
-                'end_time': clip_info.get('end_time', 0),
-                'title': clip_info.get('title', ''),
-                'description': clip_info.get('description', ''),
-                'hashtags': clip_info.get('hashtags', []),
-                'moment_type': clip_info.get('moment_type', ''),
-                'quote': clip_info.get('quote', ''),
+                'virality_score': get('virality_score', 0),
+                'start_time': get('start_time', 0),
+                'end_time': get('end_time', 0),
+                'title': get('title', ''),
+                'description': get('description', ''),
+                'hashtags': get('hashtags', []),
+                'moment_type': get('moment_type', ''),
+                'quote': get('quote', ''),
                 
                 # Additional data for earning calculation
                 'engagement_metrics': {
-                    'excitement_level': min(100, clip_info.get('virality_score', 50) + 10),
-                    'emotional_arc': min(100, clip_info.get('virality_score', 50) + 5),
-                    'hook_strength': min(100, clip_info.get('virality_score', 50) + 15)
+                    'excitement_level': engagement_base + 10 if engagement_base <= 90 else 100,
+                    'emotional_arc': engagement_base + 5 if engagement_base <= 95 else 100,
+                    'hook_strength': engagement_base + 15 if engagement_base <= 85 else 100
                 },
                 
                 # Brand safety (assume safe unless data suggests otherwise)
                 'brand_safety': self._assess_brand_safety(clip_info),
                 
                 # Processing timestamp
-                'processed_at': datetime.now().isoformat()
+                'processed_at': processed_at
             }
             
             clips.append(clip_data)
@@ -219,17 +341,21 @@ class SmartPublisher:
 
     def _assess_brand_safety(self, clip_info: Dict[str, Any]) -> Dict[str, bool]:
         """Assess brand safety of clip based on available data."""
+        key = (clip_info.get('quote', ''), clip_info.get('moment_type', ''))
+        cached = self._safety_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
         # Basic brand safety assessment
         safety = {}
         
         # Check for potential profanity in quotes
-        quote = clip_info.get('quote', '').lower()
-        profanity_words = ['damn', 'hell', 'shit', 'fuck', 'ass', 'bitch']
-        safety['profanity'] = any(word in quote for word in profanity_words)
+        quote = key[0].lower()
+        safety['profanity'] = bool(_PROFANITY_RE.search(quote))
         
         # Check moment type for violence
-        moment_type = clip_info.get('moment_type', '').lower()
-        safety['violence'] = any(word in moment_type for word in ['kill', 'death', 'murder', 'violence'])
+        moment_type = key[1].lower()
+        safety['violence'] = bool(_VIOLENCE_RE.search(moment_type))
         
         # Check for controversy (placeholder - would need more sophisticated analysis)
         safety['controversy'] = False
@@ -238,62 +364,82 @@ class SmartPublisher:
         safety['copyright'] = False
         
         # Explicit content check
-        safety['explicit'] = any(word in moment_type for word in ['sex', 'nude', 'explicit'])
+        safety['explicit'] = bool(_EXPLICIT_RE.search(moment_type))
         
-        return safety
+        self._safety_cache[key] = safety
+        return dict(safety)
 
     def _is_already_published(self, clip_data: Dict[str, Any]) -> bool:
         """Check if clip or video is already published."""
-        clip_id = clip_data.get('clip_id')
-        youtube_id = clip_data.get('youtube_id')
-        
-        published_videos = self.state.get('published_videos', [])
-        
-        # Check by clip_id
-        if clip_id in [p.get('clip_id') for p in published_videos]:
-            return True
-        
-        # Check by youtube_id (to avoid republishing same video)
-        if youtube_id in [p.get('youtube_id') for p in published_videos]:
-            return True
-        
-        return False
+        # Check by clip_id, then by youtube_id (to avoid republishing same video)
+        return (clip_data.get('clip_id') in self._published_clip_ids
+                or clip_data.get('youtube_id') in self._published_youtube_ids)
+
+    def _get_earning(self, clip: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the earning analysis for a clip, computing it once per content.
+
+        The cache key covers every field calculate_earning_potential reads,
+        so a clip whose scores change is re-analyzed.
+
+        Args:
+            clip: Clip data
+
+        Returns:
+            Earning analysis from EarningCalculator
+        """
+        key = json.dumps([
+            clip.get('clip_id'),
+            clip.get('virality_score', 0),
+            clip.get('moment_type', ''),
+            clip.get('niche', 'gaming'),
+            clip.get('engagement_metrics', {}),
+            clip.get('brand_safety', {}),
+        ], sort_keys=True, default=str)
+
+        earning_analysis = self._earning_cache.get(key)
+        if earning_analysis is None:
+            earning_analysis = self.earning_calculator.calculate_earning_potential(clip)
+            self._earning_cache[key] = earning_analysis
+        return earning_analysis
 
     def _apply_filters(self, clips: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Apply quality and safety filters to clips."""
         logger.info("Applying filters to clips...")
         
         filtered_clips = []
+
+        # Score the filter gates for the whole batch; the full earning
+        # analysis is only computed for clips that pass every filter
+        gate_scores = self.earning_calculator.calculate_gate_scores(clips)
         
-        for clip in clips:
-            # Calculate earning potential for this clip
-            earning_analysis = self.earning_calculator.calculate_earning_potential(clip)
-            
+        for clip, (virality_score, safety_score) in zip(clips, gate_scores):
             # Filter 1: Minimum virality score
-            if earning_analysis['virality_score'] < 70:
-                logger.debug(f"Filtered out clip {clip['clip_id']}: low virality ({earning_analysis['virality_score']:.1f})")
+            if virality_score < 70:
+                logger.debug("Filtered out clip %s: low virality (%.1f)", clip['clip_id'], virality_score)
                 continue
             
             # Filter 2: Brand safety
-            if earning_analysis['safety_score'] < 70:
-                logger.debug(f"Filtered out clip {clip['clip_id']}: low safety score ({earning_analysis['safety_score']:.1f})")
+            if safety_score < 70:
+                logger.debug("Filtered out clip %s: low safety score (%.1f)", clip['clip_id'], safety_score)
                 continue
             
             # Filter 3: Not already published
             if self._is_already_published(clip):
-                logger.debug(f"Filtered out clip {clip['clip_id']}: already published")
+                logger.debug("Filtered out clip %s: already published", clip['clip_id'])
                 continue
             
             # Filter 4: Has valid file path
-            if not os.path.exists(clip['clip_path']):
-                logger.warning(f"Clip file not found: {clip['clip_path']}")
+            clip_path = clip['clip_path']
+            if clip_path not in self._known_clip_files and not os.path.exists(clip_path):
+                logger.warning("Clip file not found: %s", clip['clip_path'])
                 continue
             
             # Add earning analysis to clip data
-            clip['earning_analysis'] = earning_analysis
+            clip['earning_analysis'] = self._get_earning(clip)
             filtered_clips.append(clip)
         
-        logger.info(f"Filtered {len(clips)} clips down to {len(filtered_clips)} clips")
+        logger.info("Filtered %s clips down to %s clips", len(clips), len(filtered_clips))
         return filtered_clips
 
     def _select_best_clip(self, clips: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -302,35 +448,49 @@ class SmartPublisher:
             logger.warning("No clips available for selection")
             return None
         
-        logger.info(f"Selecting best clip from {len(clips)} candidates...")
+        logger.info("Selecting best clip from %s candidates...", len(clips))
         
-        # Score all clips by earning potential
-        scored_clips = []
+        # Track the highest earning score in one pass; ties keep the earlier clip
+        best_clip, best_score = None, float('-inf')
         
         for clip in clips:
             earning_analysis = clip.get('earning_analysis')
             if not earning_analysis:
-                earning_analysis = self.earning_calculator.calculate_earning_potential(clip)
+                earning_analysis = clip['earning_analysis'] = self._get_earning(clip)
             
             score = earning_analysis['final_earning_score']
-            scored_clips.append((clip, score))
-        
-        # Sort by earning score (highest first)
-        scored_clips.sort(key=lambda x: x[1], reverse=True)
+            if score > best_score:
+                best_clip, best_score = clip, score
         
-        best_clip, best_score = scored_clips[0]
-        
-        logger.info(f"✓ SELECTED: {best_clip['clip_id']}")
-        logger.info(f"  Earning Score: {best_score:.1f}/100")
-        logger.info(f"  Expected Revenue: ${best_clip['earning_analysis']['estimated_revenue']:.2f}")
-        logger.info(f"  Expected Views: {best_clip['earning_analysis']['expected_views']:,}")
-        logger.info(f"  Niche: {best_clip['niche']} (CPM: ${best_clip['earning_analysis']['base_cpm']:.1f})")
+        logger.info("✓ SELECTED: %s", best_clip['clip_id'])
+        logger.info("  Earning Score: %.1f/100", best_score)
+        logger.info("  Expected Revenue: $%.2f", best_clip['earning_analysis']['estimated_revenue'])
+        logger.info("  Expected Views: %s", format(best_clip['earning_analysis']['expected_views'], ','))
+        logger.info("  Niche: %s (CPM: $%.1f)", best_clip['niche'], best_clip['earning_analysis']['base_cpm'])
         
         return best_clip
 
     def _publish_to_platforms(self, clip_data: Dict[str, Any]) -> Dict[str, Any]:
         """Publish selected clip to all platforms."""
+        return asyncio.run(self._publish_to_platforms_async(clip_data))
+
+    async def _publish_to_platforms_async(self, clip_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Publish a clip to all platforms concurrently.
+
+        The platforms are independent services with no shared rate limit,
+        so all uploads start at once and the step takes as long as the
+        slowest one. Each blocking publisher runs in a worker thread.
+
+        Args:
+            clip_data: Selected clip
+
+        Returns:
+            Per-platform results with success and total counts
+        """
         logger.info("Publishing to platforms...")
+        # Publisher setup reads credential files and builds API clients
+        await asyncio.to_thread(self._ensure_publishers)
         
         results = {
             'platforms': {},
@@ -348,59 +508,72 @@ class SmartPublisher:
             'moment_type': clip_data['moment_type'],
             'virality_score': clip_data.get('virality_score', 0)
         }
-        
-        for platform_name, publisher in self.publishers.items():
-            try:
-                logger.info(f"Publishing to {platform_name}...")
-                
-                # Prepare clip data for platform
-                clip_for_platform = {
-                    'clip_path': clip_data['clip_path'],
-                    'metadata': platform_metadata,
-                    'moment': {
-                        'start': clip_data.get('start_time', 0),
-                        'end': clip_data.get('end_time', 0),
-                        'type': clip_data.get('moment_type', ''),
-                        'quote': clip_data.get('quote', '')
-                    }
+
+        async def publish_one(platform_name: str, publisher: Any) -> Any:
+            # Only wait out whatever remains of this platform's own interval
+            min_interval = PLATFORM_MIN_INTERVAL_SECONDS.get(platform_name, 0)
+            last_publish = self._last_publish_at.get(platform_name)
+            if min_interval and last_publish is not None:
+                wait = min_interval - (time.monotonic() - last_publish)
+                if wait > 0:
+                    logger.info("Publishing to %s in %.0f seconds...", platform_name, wait)
+                    await asyncio.sleep(wait)
+            logger.info("Publishing to %s...", platform_name)
+
+            # Prepare clip data for platform
+            clip_for_platform = {
+                'clip_path': clip_data['clip_path'],
+                'metadata': platform_metadata,
+                'moment': {
+                    'start': clip_data.get('start_time', 0),
+                    'end': clip_data.get('end_time', 0),
+                    'type': clip_data.get('moment_type', ''),
+                    'quote': clip_data.get('quote', '')
                 }
-                
-                # Publish to platform
-                result = publisher.publish_clip(clip_for_platform)
-                
-                if result and result.get('status') == 'published':
-                    results['platforms'][platform_name] = result
-                    results['success_count'] += 1
-                    logger.info(f"✓ Successfully published to {platform_name}")
-                else:
-                    results['platforms'][platform_name] = result or {'status': 'failed'}
-                    logger.warning(f"✗ Failed to publish to {platform_name}")
-                
-                results['total_count'] += 1
-                
-                # Add delay between platforms to avoid rate limits
-                if platform_name != list(self.publishers.keys())[-1]:
-                    logger.info("Waiting 30 seconds between platforms...")
-                    time.sleep(30)
-                
+            }
+
+            try:
+                return await asyncio.to_thread(publisher.publish_clip, clip_for_platform)
             except Exception as e:
-                logger.error(f"Error publishing to {platform_name}: {e}")
+                return e
+            finally:
+                self._last_publish_at[platform_name] = time.monotonic()
+
+        platform_names = list(self.publishers)
+        outcomes = await asyncio.gather(*(
+            publish_one(name, self.publishers[name]) for name in platform_names
+        ))
+
+        for platform_name, result in zip(platform_names, outcomes):
+            results['total_count'] += 1
+
+            if isinstance(result, Exception):
+                logger.error("Error publishing to %s: %s", platform_name, result)
                 results['platforms'][platform_name] = {
                     'status': 'error',
-                    'error': str(e)
+                    'error': str(result)
                 }
-                results['total_count'] += 1
+            elif result and result.get('status') == 'published':
+                results['platforms'][platform_name] = result
+                results['success_count'] += 1
+                logger.info("✓ Successfully published to %s", platform_name)
+            else:
+                results['platforms'][platform_name] = result or {'status': 'failed'}
+                logger.warning("✗ Failed to publish to %s", platform_name)
         
         return results
 
     def _update_state(self, clip_data: Dict[str, Any], publish_results: Dict[str, Any]):
         """Update state after successful publishing."""
+        now = datetime.now()
+        now_iso = now.isoformat()
+
         # Add to published videos
         published_entry = {
             'clip_id': clip_data['clip_id'],
             'youtube_id': clip_data['youtube_id'],
             'platform': clip_data['platform'],
-            'published_at': datetime.now().isoformat(),
+            'published_at': now_iso,
             'virality_score': clip_data.get('virality_score', 0),
             'earning_score': clip_data['earning_analysis']['final_earning_score'],
             'estimated_revenue': clip_data['earning_analysis']['estimated_revenue'],
@@ -409,16 +582,18 @@ class SmartPublisher:
         }
         
         self.state['published_videos'].append(published_entry)
+        self._published_clip_ids.add(published_entry['clip_id'])
+        self._published_youtube_ids.add(published_entry['youtube_id'])
         self.state['total_published'] += 1
-        self.state['last_published'] = datetime.now().isoformat()
+        self.state['last_published'] = now_iso
         
         # Update daily count
-        today = datetime.now().strftime('%Y-%m-%d')
+        today = now.strftime('%Y-%m-%d')
         self.state['daily_count'][today] = self.state['daily_count'].get(today, 0) + 1
         
         # Add to publishing history
         self.state['publishing_history'].append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso,
             'clip_id': clip_data['clip_id'],
             'success_count': publish_results['success_count'],
             'total_count': publish_results['total_count'],
@@ -429,15 +604,24 @@ class SmartPublisher:
         # Keep only last 100 entries to prevent file from growing too large
         if len(self.state['publishing_history']) > 100:
             self.state['publishing_history'] = self.state['publishing_history'][-100:]
+
+        # Bound the dedup list and the daily counts the same way
+        if len(self.state['published_videos']) > PUBLISHED_VIDEOS_LIMIT:
+            self.state['published_videos'] = self.state['published_videos'][-PUBLISHED_VIDEOS_LIMIT:]
+        cutoff = (now - timedelta(days=DAILY_COUNT_DAYS)).strftime('%Y-%m-%d')
+        self.state['daily_count'] = {
+            day: count for day, count in self.state['daily_count'].items() if day >= cutoff
+        }
         
         # Save updated state
+        self._state_dirty = True
         self._save_state()
 
     def run_smart_publishing(self) -> Dict[str, Any]:
         """Run the complete smart publishing process."""
-        logger.info("=" * 60)
+        logger.info(_BANNER)
         logger.info("🚀 STARTING SMART 1-VIDEO PUBLISHING")
-        logger.info("=" * 60)
+        logger.info(_BANNER)
 
         try:
             # Step 0: Check daily limit
@@ -465,7 +649,7 @@ class SmartPublisher:
                     'published_count': 0
                 }
 
-            logger.info(f"✓ Found {len(all_clips)} clips to evaluate")
+            logger.info("✓ Found %s clips to evaluate", len(all_clips))
             
             # Step 2: Apply filters
             logger.info("\n🔍 Step 2: Applying quality filters...")
@@ -479,7 +663,7 @@ class SmartPublisher:
                     'published_count': 0
                 }
             
-            logger.info(f"✓ {len(filtered_clips)} clips passed quality filters")
+            logger.info("✓ %s clips passed quality filters", len(filtered_clips))
             
             # Step 3: Select best clip
             logger.info("\n🎯 Step 3: Selecting best earning clip...")
@@ -494,7 +678,7 @@ class SmartPublisher:
                 }
             
             # Step 4: Publish to platforms
-            logger.info(f"\n🚀 Step 4: Publishing {selected_clip['clip_id']} to platforms...")
+            logger.info("\n🚀 Step 4: Publishing %s to platforms...", selected_clip['clip_id'])
             publish_results = self._publish_to_platforms(selected_clip)
             
             # Step 5: Update state
@@ -507,18 +691,18 @@ class SmartPublisher:
             total_published = self.state['total_published']
             today_count = self.state['daily_count'].get(datetime.now().strftime('%Y-%m-%d'), 0)
             
-            logger.info("\n" + "=" * 60)
+            logger.info("\n%s", _BANNER)
             logger.info("📊 PUBLISHING SUMMARY")
-            logger.info("=" * 60)
-            logger.info(f"✓ Published: {publish_results['success_count']}/{publish_results['total_count']} platforms")
-            logger.info(f"✓ Clip: {selected_clip['clip_id']}")
-            logger.info(f"✓ Earning Score: {selected_clip['earning_analysis']['final_earning_score']:.1f}/100")
-            logger.info(f"✓ Estimated Revenue: ${selected_clip['earning_analysis']['estimated_revenue']:.2f}")
-            logger.info(f"✓ Expected Views: {selected_clip['earning_analysis']['expected_views']:,}")
-            logger.info(f"✓ Niche: {selected_clip['niche']} (CPM: ${selected_clip['earning_analysis']['base_cpm']:.1f})")
-            logger.info(f"📈 Total published: {total_published}")
-            logger.info(f"📅 Published today: {today_count}")
-            logger.info("=" * 60)
+            logger.info(_BANNER)
+            logger.info("✓ Published: %s/%s platforms", publish_results['success_count'], publish_results['total_count'])
+            logger.info("✓ Clip: %s", selected_clip['clip_id'])
+            logger.info("✓ Earning Score: %.1f/100", selected_clip['earning_analysis']['final_earning_score'])
+            logger.info("✓ Estimated Revenue: $%.2f", selected_clip['earning_analysis']['estimated_revenue'])
+            logger.info("✓ Expected Views: %s", format(selected_clip['earning_analysis']['expected_views'], ','))
+            logger.info("✓ Niche: %s (CPM: $%.1f)", selected_clip['niche'], selected_clip['earning_analysis']['base_cpm'])
+            logger.info("📈 Total published: %s", total_published)
+            logger.info("📅 Published today: %s", today_count)
+            logger.info(_BANNER)
             
             return {
                 'success': True,
@@ -532,7 +716,7 @@ class SmartPublisher:
             }
             
         except Exception as e:
-            logger.error(f"❌ Smart publishing failed: {e}", exc_info=True)
+            logger.error("❌ Smart publishing failed: %s", e, exc_info=True)
             return {
                 'success': False,
                 'error': str(e),
@@ -541,8 +725,9 @@ class SmartPublisher:
 
     def get_state_summary(self) -> Dict[str, Any]:
         """Get summary of current publishing state."""
-        today = datetime.now().strftime('%Y-%m-%d')
-        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        now = datetime.now()
+        last_7_days = [(now - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(7)]
+        today, yesterday = last_7_days[0], last_7_days[1]
         
         return {
             'total_published': self.state['total_published'],
@@ -550,7 +735,7 @@ class SmartPublisher:
             'published_yesterday': self.state['daily_count'].get(yesterday, 0),
             'last_published': self.state['last_published'],
             'recent_published': self.state['published_videos'][-5:] if self.state['published_videos'] else [],
-            'publishing_rate_7_days': sum(self.state['daily_count'].get((datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d'), 0) for i in range(7))
+            'publishing_rate_7_days': sum(self.state['daily_count'].get(day, 0) for day in last_7_days)
         }
 
 def main():
@@ -565,7 +750,7 @@ def main():
     args = parser.parse_args()
     
     # Initialize smart publisher
-    publisher = SmartPublisher(state_file=args.state_file)
+    publisher = SmartPublisher(state_file=args.state_file, init_publishers=not args.dry_run)
     
     # Show state summary
     state_summary = publisher.get_state_summary()
@@ -8,6 +8,8 @@ import os
 import logging
 from typing import Optional, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 
 logging.basicConfig(level=logging.INFO)
@@ -29,6 +31,17 @@ class InstagramPublisher:
         self.access_token = access_token or os.getenv('INSTAGRAM_ACCESS_TOKEN')
         self.api_base_url = 'https://graph.facebook.com/v18.0'
 
+        # One keep-alive session so the API calls of an upload share a
+        # TCP/TLS connection; only reads retry transient errors, since a
+        # replayed POST/PUT could publish twice or resend a consumed body
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=frozenset({'GET', 'HEAD'}))
+        ))
+
         if not self.access_token:
             logger.warning("Instagram access token not provided. Uploads will be mocked.")
 
@@ -70,7 +83,7 @@ class InstagramPublisher:
                 f"&caption={caption}"
             )
 
-            response = requests.post(container_url)
+            response = self._http.post(container_url)
             if not response.ok:
                 logger.error(f"Failed to create container: {response.text}")
                 return None
@@ -84,7 +97,7 @@ class InstagramPublisher:
                 f"&creation_id={container_id}"
             )
 
-            publish_response = requests.post(publish_url)
+            publish_response = self._http.post(publish_url)
             if publish_response.ok:
                 return publish_response.json().get('id')
             else:
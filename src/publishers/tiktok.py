@@ -8,7 +8,14 @@ import os
 import logging
 from typing import Optional, Dict, Any
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson encodes request bodies and parses responses in C; stdlib json is the fallback
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,9 +37,34 @@ class TikTokPublisher:
         self.access_token = access_token or os.getenv('TIKTOK_ACCESS_TOKEN')
         self.api_base_url = 'https://open.tiktokapis.com/v2'
 
-        if not self.access_token:
+        # One keep-alive session so the API calls of an upload share a
+        # TCP/TLS connection; only reads retry transient errors, since a
+        # replayed POST/PUT could publish twice or resend a consumed body
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=frozenset({'GET', 'HEAD'}))
+        ))
+
+        # API bodies are pre-encoded JSON; the video PUT overrides Content-Type
+        self._http.headers['Content-Type'] = 'application/json'
+        if self.access_token:
+            self._http.headers['Authorization'] = f'Bearer {self.access_token}'
+        else:
             logger.warning("TikTok access token not provided. Uploads will be mocked.")
 
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self._http.close()
+
+    def __enter__(self) -> 'TikTokPublisher':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def upload_clip(self, clip_path: str, caption: str,
                     hashtags: list, privacy: str = 'public') -> Optional[str]:
         """
@@ -61,28 +93,31 @@ class TikTokPublisher:
         # Real implementation would look like:
         """
         try:
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
+            # The session sends the Authorization and Content-Type headers
+            video_size = os.path.getsize(clip_path)
 
             # First, get upload URL
-            response = requests.post(
+            response = self._http.post(
                 f'{self.api_base_url}/video/upload/',
-                headers=headers,
-                json={'video_size': os.path.getsize(clip_path)}
+                data=_json.dumps({'video_size': video_size})
             )
 
             if not response.ok:
                 logger.error(f"Failed to get upload URL: {response.text}")
                 return None
 
-            upload_data = response.json()
+            upload_data = _json.loads(response.content)
             upload_url = upload_data['data']['upload_url']
 
-            # Upload video file
+            # Upload video file; passing the open file streams it from disk
+            # in small blocks, so memory stays flat regardless of clip size
             with open(clip_path, 'rb') as f:
-                upload_response = requests.put(upload_url, data=f)
+                upload_response = self._http.put(
+                    upload_url,
+                    data=f,
+                    headers={'Content-Type': 'video/mp4',
+                             'Content-Length': str(video_size)}
+                )
 
             if not upload_response.ok:
                 logger.error(f"Upload failed: {upload_response.text}")
@@ -95,14 +130,13 @@ class TikTokPublisher:
                 'hashtag_ids': hashtags
             }
 
-            complete_response = requests.post(
+            complete_response = self._http.post(
                 f'{self.api_base_url}/video/publish/',
-                headers=headers,
-                json=complete_data
+                data=_json.dumps(complete_data)
             )
 
             if complete_response.ok:
-                return complete_response.json()['data']['video_id']
+                return _json.loads(complete_response.content)['data']['video_id']
             else:
                 logger.error(f"Failed to complete upload: {complete_response.text}")
                 return None
@@ -165,16 +199,15 @@ def main():
 
     clip_path = sys.argv[1]
 
-    publisher = TikTokPublisher()
-
-    result = publisher.publish_clip({
-        'clip_path': clip_path,
-        'metadata': {
-            'title': 'Test TikTok',
-            'description': 'This is a test',
-            'hashtags': ['#test', '#gaming']
-        }
-    })
+    with TikTokPublisher() as publisher:
+        result = publisher.publish_clip({
+            'clip_path': clip_path,
+            'metadata': {
+                'title': 'Test TikTok',
+                'description': 'This is a test',
+                'hashtags': ['#test', '#gaming']
+            }
+        })
 
     if result:
         print(f"Published: {result.get('url')}")
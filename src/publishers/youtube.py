@@ -6,7 +6,7 @@ Handles authentication, metadata, and upload process.
 
 import os
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import pickle
 import json
 
@@ -25,6 +25,44 @@ logger = logging.getLogger(__name__)
 # OAuth2 scopes
 SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
 
+# Resumable upload chunk size (a multiple of 256 KiB, as the API requires)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Retries per chunk on 5xx/429 and connection errors, with exponential backoff
+UPLOAD_NUM_RETRIES = 5
+
+# Most video IDs a single videos().list call accepts
+VIDEOS_LIST_MAX_IDS = 50
+
+# Loaded credentials by credentials file path, with the file mtime they were read at
+_CREDENTIALS_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+def _load_credentials(credentials_file: str) -> Optional[Any]:
+    """Unpickle stored credentials, reusing the object while the file is unchanged."""
+    try:
+        mtime = os.stat(credentials_file).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _CREDENTIALS_CACHE.get(credentials_file)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(credentials_file, 'rb') as token:
+        credentials = pickle.load(token)
+    _CREDENTIALS_CACHE[credentials_file] = (mtime, credentials)
+    return credentials
+
+def _save_credentials(credentials_file: str, credentials: Any) -> None:
+    """Atomically pickle credentials to disk and remember them in the cache."""
+    # Write beside the target and swap it in, so a crash mid-write never
+    # leaves a truncated credentials file for the next run to unpickle
+    tmp_path = credentials_file + '.tmp'
+    with open(tmp_path, 'wb') as token:
+        pickle.dump(credentials, token)
+    os.replace(tmp_path, credentials_file)
+    _CREDENTIALS_CACHE[credentials_file] = (os.stat(credentials_file).st_mtime_ns, credentials)
+
 class YouTubePublisher:
     """Publish clips to YouTube Shorts."""
 
@@ -51,9 +89,7 @@ class YouTubePublisher:
     def _authenticate(self) -> bool:
         """Authenticate with YouTube API."""
         # Load credentials from file if available
-        if os.path.exists(self.credentials_file):
-            with open(self.credentials_file, 'rb') as token:
-                self.credentials = pickle.load(token)
+        self.credentials = _load_credentials(self.credentials_file)
 
         # Refresh or create credentials
         if not self.credentials or not self.credentials.valid:
@@ -66,13 +102,15 @@ class YouTubePublisher:
                 self.credentials = flow.run_local_server(port=0)
 
                 # Save credentials
-                with open(self.credentials_file, 'wb') as token:
-                    pickle.dump(self.credentials, token)
+                _save_credentials(self.credentials_file, self.credentials)
             else:
                 logger.warning("No valid credentials and no client secrets file")
                 return False
 
-        self.youtube = build('youtube', 'v3', credentials=self.credentials)
+        # Each instance gets its own client (the httplib2 transport is not
+        # thread-safe); the bundled discovery document avoids a network fetch
+        self.youtube = build('youtube', 'v3', credentials=self.credentials,
+                             cache_discovery=False, static_discovery=True)
         logger.info("Successfully authenticated with YouTube API")
         return True
 
@@ -110,10 +148,12 @@ class YouTubePublisher:
                 }
             }
 
-            # Prepare media upload
+            # Prepare media upload in chunks, so a transient failure only
+            # resends the current chunk and progress can be reported
             media = MediaFileUpload(
                 clip_path,
                 mimetype='video/mp4',
+                chunksize=UPLOAD_CHUNK_SIZE,
                 resumable=True
             )
 
@@ -126,8 +166,12 @@ class YouTubePublisher:
 
             logger.info(f"Starting upload: {clip_path}")
 
-            # Upload with progress callback
-            response = request.execute()
+            # Upload chunk by chunk; next_chunk retries a failed chunk itself
+            response = None
+            while response is None:
+                status, response = request.next_chunk(num_retries=UPLOAD_NUM_RETRIES)
+                if status:
+                    logger.info(f"Uploaded {int(status.progress() * 100)}%")
 
             video_id = response.get('id')
             if video_id:
@@ -198,12 +242,7 @@ class YouTubePublisher:
             response = request.execute()
 
             if response.get('items'):
-                stats = response['items'][0]['statistics']
-                return {
-                    'views': int(stats.get('viewCount', 0)),
-                    'likes': int(stats.get('likeCount', 0)),
-                    'comments': int(stats.get('commentCount', 0))
-                }
+                return _parse_statistics(response['items'][0]['statistics'])
 
             return None
 
@@ -211,6 +250,51 @@ class YouTubePublisher:
             logger.error(f"Failed to get video stats: {e}")
             return None
 
+    def get_video_stats_batch(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get statistics for many published videos.
+
+        IDs are sent VIDEOS_LIST_MAX_IDS at a time as one comma-separated
+        videos().list call, so N videos cost ceil(N/50) requests and quota
+        units instead of N.
+
+        Args:
+            video_ids: YouTube video IDs
+
+        Returns:
+            Stats keyed by video ID; videos that were not found or whose
+            request failed are omitted
+        """
+        stats_by_id = {}
+        if not self.youtube:
+            return stats_by_id
+
+        unique_ids = list(dict.fromkeys(video_ids))
+        for i in range(0, len(unique_ids), VIDEOS_LIST_MAX_IDS):
+            batch = unique_ids[i:i + VIDEOS_LIST_MAX_IDS]
+            try:
+                response = self.youtube.videos().list(
+                    part='statistics',
+                    id=','.join(batch),
+                    maxResults=VIDEOS_LIST_MAX_IDS
+                ).execute()
+            except Exception as e:
+                logger.error(f"Failed to get video stats for {len(batch)} videos: {e}")
+                continue
+
+            for item in response.get('items', []):
+                stats_by_id[item['id']] = _parse_statistics(item['statistics'])
+
+        return stats_by_id
+
+def _parse_statistics(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a videos().list statistics resource to integer counts."""
+    return {
+        'views': int(stats.get('viewCount', 0)),
+        'likes': int(stats.get('likeCount', 0)),
+        'comments': int(stats.get('commentCount', 0))
+    }
+
 def main():
     """Test YouTube publisher."""
     import sys
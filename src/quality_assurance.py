@@ -6,7 +6,8 @@ Checks for profanity, copyright issues, and quality standards.
 
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 import re
 
 logging.basicConfig(level=logging.INFO)
@@ -18,6 +19,48 @@ PROFANITY_LIST = [
     'nigger', 'nigga', 'fag', 'faggot', 'retard'
 ]
 
+def _trie_regex(words: List[str]) -> str:
+    """
+    Build a prefix-factored alternation matching exactly the given words.
+
+    re tries each branch of a flat alternation in turn at every position;
+    sharing prefixes ('fag', 'faggot' -> 'fag(?:got)?') means each input
+    character is compared against each distinct prefix once, like a DFA.
+
+    Args:
+        words: Literal words to match
+
+    Returns:
+        Regex source without surrounding group or anchors
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def render(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + render(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            body = '(?:' + body + ')?'
+        return body
+
+    return render(trie)
+
+# Compiled once at import; \b keeps matches to whole words
+PROFANITY_PATTERN = re.compile(r'\b(' + _trie_regex(PROFANITY_LIST) + r')\b', re.IGNORECASE)
+
+# Phrases in a quote that suggest copyrighted material, checked in order
+COPYRIGHT_INDICATORS = (
+    'copyright', 'licensed', 'owned by', 'property of',
+    'all rights reserved', 'official'
+)
+
 class QualityAssurance:
     """Validate clips for quality and compliance."""
 
@@ -29,10 +72,10 @@ class QualityAssurance:
             strictness: 'strict', 'moderate', or 'lenient'
         """
         self.strictness = strictness
-        self.profanity_pattern = re.compile(
-            r'\b(' + '|'.join(PROFANITY_LIST) + r')\b',
-            re.IGNORECASE
-        )
+        self.profanity_pattern = PROFANITY_PATTERN
+        # The platforms of one moment share its quote, so the text checks
+        # run once per quote instead of once per platform
+        self._text_checks = lru_cache(maxsize=256)(self._run_text_checks)
 
     def check_clip(self, clip_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -55,23 +98,32 @@ class QualityAssurance:
             'scores': {}
         }
 
-        # Check duration
+        # Check duration (cheapest check first)
         duration_score, duration_issues = self._check_duration(clip_data)
         report['scores']['duration'] = duration_score
         report['issues'].extend(duration_issues)
 
-        # Check content
-        content_score, content_issues = self._check_content(clip_data)
+        # In strict mode a critical duration issue already fails the clip,
+        # so skip the text scans; skipped checks are listed, not scored
+        if self.strictness == 'strict' and any(
+                i['severity'] == 'critical' for i in duration_issues):
+            report['skipped'] = ['content', 'profanity', 'copyright']
+            report['overall_score'] = duration_score
+            report['passed'] = False
+            return report
+
+        # Check content, profanity and copyright (depend only on the quote)
+        content, profanity, copyright = self._text_checks(clip_data.get('quote', ''))
+
+        content_score, content_issues = content
         report['scores']['content'] = content_score
         report['issues'].extend(content_issues)
 
-        # Check profanity
-        profanity_score, profanity_issues = self._check_profanity(clip_data)
+        profanity_score, profanity_issues = profanity
         report['scores']['profanity'] = profanity_score
         report['warnings'].extend(profanity_issues)
 
-        # Check copyright
-        copyright_score, copyright_issues = self._check_copyright(clip_data)
+        copyright_score, copyright_issues = copyright
         report['scores']['copyright'] = copyright_score
         report['issues'].extend(copyright_issues)
 
@@ -88,11 +140,20 @@ class QualityAssurance:
 
         report['passed'] = (
             report['overall_score'] >= threshold and
-            len([i for i in report['issues'] if i['severity'] == 'critical']) == 0
+            not any(i['severity'] == 'critical' for i in report['issues'])
         )
 
         return report
 
+    def _run_text_checks(self, quote: str) -> Tuple[tuple, tuple, tuple]:
+        """Run the content, profanity and copyright checks for a quote."""
+        clip_data = {'quote': quote}
+        return (
+            self._check_content(clip_data),
+            self._check_profanity(clip_data),
+            self._check_copyright(clip_data)
+        )
+
     def _check_duration(self, clip_data: Dict[str, Any]) -> tuple[int, List[Dict]]:
         """Check if clip duration is appropriate."""
         issues = []
@@ -197,14 +258,11 @@ class QualityAssurance:
         issues = []
         score = 100
 
-        # Check for common copyright indicators in quote
+        # Check for common copyright indicators in quote; plain substring
+        # tests run in C and beat a regex alternation for this few phrases
         quote = clip_data.get('quote', '').lower()
-        copyright_indicators = [
-            'copyright', 'licensed', 'owned by', 'property of',
-            'all rights reserved', 'official'
-        ]
 
-        for indicator in copyright_indicators:
+        for indicator in COPYRIGHT_INDICATORS:
             if indicator in quote:
                 issues.append({
                     'type': 'copyright',
@@ -5,8 +5,10 @@ Generates metadata to maximize discoverability on social platforms.
 """
 
 import os
+import json
 import logging
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 import random
 
 try:
@@ -26,12 +28,78 @@ GAMING_HASHTAGS = [
     '#insane', '#funny', '#wtf', '#omg', '#letsplay', '#gameplay'
 ]
 
+# Platform-specific title length limits
+TITLE_LENGTH_LIMITS = {
+    'youtube_shorts': 100,
+    'tiktok': 150,
+    'instagram_reels': 125
+}
+
 NICHES_TO_HASHTAGS = {
     'Roblox': ['#roblox', '#robloxfyp', '#bloxfruits', '#robloxedit', '#adoptme'],
     'Horror games': ['#horror', '#horrorgame', '#scary', '#jumscare', '#horrorclips'],
     'Fortnite': ['#fortnite', '#fortniteclips', '#epicgames', '#battleroyale', '#fortnitetiktok']
 }
 
+MOMENT_HASHTAGS = {
+    'exciting': ['#epic', '#insane', '#crazy', '#unreal', '#skill'],
+    'funny': ['#funny', '#hilarious', '#lol', '#comedy', '#lmao'],
+    'shocking': ['#wtf', '#shocking', '#unbelievable', '#insane', '#viral'],
+    'emotional': ['#emotional', '#sad', '#wholesome', '#feels', '#wholesomegaming']
+}
+
+# Title templates per moment type as (format, max quote chars); a width of
+# None means the template does not include the quote
+TITLE_TEMPLATES = {
+    'exciting': [
+        ("OMG! {quote} 😱🔥", 30),
+        ("YOU WON'T BELIEVE THIS! {quote}", 25),
+        ("INSANE MOMENT! {quote} 🔥", 30),
+        ("WTF?! {quote} 💀", 30)
+    ],
+    'funny': [
+        ("LMFAO! {quote} 😂", 30),
+        ("THIS IS HILARIOUS! {quote}", 25),
+        ("CAN'T STOP LAUGHING! {quote} 🤣", 30),
+        ("BRUH! {quote} 😭", 30)
+    ],
+    'shocking': [
+        ("NO WAY! {quote} 😱", 30),
+        ("ARE YOU SERIOUS?! {quote}", 25),
+        ("I'M SHOOK! {quote} 💀", 30),
+        ("THIS CHANGED EVERYTHING! {quote}", 25)
+    ],
+    'emotional': [
+        ("This hit different... {quote} 😢", 30),
+        ("WHY DID I WATCH THIS 😭", None),
+        ("My heart... {quote} 💔", 25),
+        ("NOT ME CRYING 😭🤧", None)
+    ]
+}
+
+@lru_cache(maxsize=32)
+def _batch_title_prompt_prefix(niche: str) -> str:
+    """Build the static part of the batch title prompt for a niche."""
+    return f"""Generate a viral, clickbait-style title for each gaming clip below.
+
+Requirements:
+- Game: {niche}
+- Respect each clip's max_length in characters
+- Use emojis but don't overdo it (2-3 max)
+- Make it exciting and shareable
+- MUST include the quote or a variation of it
+
+Clips:
+"""
+
+@lru_cache(maxsize=64)
+def _base_hashtags(niche: str, moment_type: str) -> Tuple[str, ...]:
+    """Get the deduplicated hashtag pool for a niche and moment type."""
+    hashtags = set(GAMING_HASHTAGS[:8])
+    hashtags.update(NICHES_TO_HASHTAGS.get(niche, []))
+    hashtags.update(MOMENT_HASHTAGS.get(moment_type, []))
+    return tuple(hashtags)
+
 class SEOGenerator:
     """Generate SEO-optimized metadata for social media posts."""
 
@@ -64,15 +132,7 @@ class SEOGenerator:
         """
         quote = moment.get('quote', '').strip()
         moment_type = moment.get('type', 'exciting')
-
-        # Platform-specific length limits
-        length_limits = {
-            'youtube_shorts': 100,
-            'tiktok': 150,
-            'instagram_reels': 125
-        }
-
-        max_length = length_limits.get(platform, 100)
+        max_length = TITLE_LENGTH_LIMITS.get(platform, 100)
 
         # Use AI if available
         if self.use_ai:
@@ -80,36 +140,19 @@ class SEOGenerator:
             if title:
                 return title
 
-        # Fallback to template-based generation
-        title_templates = {
-            'exciting': [
-                f"OMG! {self._truncate_quote(quote, 30)} 😱🔥",
-                f"YOU WON'T BELIEVE THIS! {self._truncate_quote(quote, 25)}",
-                f"INSANE MOMENT! {self._truncate_quote(quote, 30)} 🔥",
-                f"WTF?! {self._truncate_quote(quote, 30)} 💀"
-            ],
-            'funny': [
-                f"LMFAO! {self._truncate_quote(quote, 30)} 😂",
-                f"THIS IS HILARIOUS! {self._truncate_quote(quote, 25)}",
-                f"CAN'T STOP LAUGHING! {self._truncate_quote(quote, 30)} 🤣",
-                f"BRUH! {self._truncate_quote(quote, 30)} 😭"
-            ],
-            'shocking': [
-                f"NO WAY! {self._truncate_quote(quote, 30)} 😱",
-                f"ARE YOU SERIOUS?! {self._truncate_quote(quote, 25)}",
-                f"I'M SHOOK! {self._truncate_quote(quote, 30)} 💀",
-                f"THIS CHANGED EVERYTHING! {self._truncate_quote(quote, 25)}"
-            ],
-            'emotional': [
-                f"This hit different... {self._truncate_quote(quote, 30)} 😢",
-                f"WHY DID I WATCH THIS 😭",
-                f"My heart... {self._truncate_quote(quote, 25)} 💔",
-                f"NOT ME CRYING 😭🤧"
-            ]
-        }
-
-        templates = title_templates.get(moment_type, title_templates['exciting'])
-        title = random.choice(templates)
+        return self._template_title(quote, moment_type, niche, max_length)
+
+    def _template_title(self, quote: str, moment_type: str,
+                        niche: str, max_length: int) -> str:
+        """Build a title from the clickbait templates (no AI)."""
+        # Only the chosen template is formatted
+        template, quote_chars = random.choice(
+            TITLE_TEMPLATES.get(moment_type, TITLE_TEMPLATES['exciting'])
+        )
+        if quote_chars is None:
+            title = template
+        else:
+            title = template.format(quote=self._truncate_quote(quote, quote_chars))
 
         # Add niche context
         if niche and niche != 'gaming':
@@ -158,6 +201,62 @@ Return ONLY the title, no explanation."""
             logger.warning(f"AI title generation failed: {e}")
             return None
 
+    def _generate_ai_titles_batch(self, items: List[Tuple[Dict[str, Any], str]],
+                                  niche: str) -> Dict[int, str]:
+        """
+        Use a single Gemini request to generate titles for many clips.
+
+        Args:
+            items: (moment, platform) pairs
+            niche: Game niche/category
+
+        Returns:
+            Dictionary mapping item index to title; missing or invalid
+            entries are left out
+        """
+        lines = []
+        for i, (moment, platform) in enumerate(items):
+            quote = moment.get('quote', '').strip().replace('"', "'")
+            lines.append(
+                f'{i}. type={moment.get("type", "exciting")}, platform={platform}, '
+                f'max_length={TITLE_LENGTH_LIMITS.get(platform, 100)}, quote="{quote}"'
+            )
+
+        prompt = _batch_title_prompt_prefix(niche) + '\n'.join(lines) + """
+
+Return ONLY a JSON array in this exact format (no markdown, no explanation):
+[{"i": <clip_number>, "title": "<title>"}]"""
+
+        try:
+            response = self.model.generate_content(prompt)
+            response_text = response.text.strip()
+
+            # Remove markdown if present
+            if response_text.startswith('```'):
+                response_text = response_text.strip('```').strip()
+                if response_text.startswith('json'):
+                    response_text = response_text[4:].strip()
+
+            entries = json.loads(response_text)
+        except Exception as e:
+            logger.warning(f"AI batch title generation failed: {e}")
+            return {}
+
+        titles = {}
+        for entry in entries if isinstance(entries, list) else []:
+            try:
+                i = int(entry['i'])
+                title = str(entry['title']).strip().strip('"').strip("'")
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            if 0 <= i < len(items):
+                max_length = TITLE_LENGTH_LIMITS.get(items[i][1], 100)
+                if 10 < len(title) <= max_length:
+                    titles[i] = title
+
+        return titles
+
     def _truncate_quote(self, quote: str, max_chars: int) -> str:
         """Truncate quote while keeping it readable."""
         if len(quote) <= max_chars:
@@ -193,26 +292,8 @@ Return ONLY the title, no explanation."""
         Returns:
             List of hashtag strings
         """
-        hashtags = set()
-
-        # Add general gaming hashtags
-        hashtags.update(GAMING_HASHTAGS[:8])
-
-        # Add niche-specific hashtags
-        if niche in NICHES_TO_HASHTAGS:
-            hashtags.update(NICHES_TO_HASHTAGS[niche])
-
-        # Add moment-specific hashtags
-        moment_hashtags = {
-            'exciting': ['#epic', '#insane', '#crazy', '#unreal', '#skill'],
-            'funny': ['#funny', '#hilarious', '#lol', '#comedy', '#lmao'],
-            'shocking': ['#wtf', '#shocking', '#unbelievable', '#insane', '#viral'],
-            'emotional': ['#emotional', '#sad', '#wholesome', '#feels', '#wholesomegaming']
-        }
-        hashtags.update(moment_hashtags.get(moment_type, []))
-
-        # Convert to list and shuffle
-        hashtag_list = list(hashtags)
+        # General, niche-specific and moment-specific hashtags, then shuffle
+        hashtag_list = list(_base_hashtags(niche, moment_type))
         random.shuffle(hashtag_list)
 
         # Return requested count
@@ -227,6 +308,51 @@ Return ONLY the title, no explanation."""
             Dictionary with title, description, hashtags
         """
         title = self.generate_title(moment, niche, platform)
+        return self._build_metadata(moment, niche, platform, title)
+
+    def generate_metadata_batch(self, items: List[Tuple[Dict[str, Any], str]],
+                                niche: str = 'gaming') -> Dict[int, Dict[str, Any]]:
+        """
+        Generate metadata for many clips with at most one Gemini request.
+
+        Args:
+            items: (moment, platform) pairs
+            niche: Game niche/category
+
+        Returns:
+            Dictionary mapping item index to its metadata package
+        """
+        ai_titles = self._generate_ai_titles_batch(items, niche) if self.use_ai and items else {}
+
+        metadata = {}
+        for i, (moment, platform) in enumerate(items):
+            title = ai_titles.get(i)
+            if title is None:
+                metadata[i] = self.generate_template_metadata(moment, niche, platform)
+            else:
+                metadata[i] = self._build_metadata(moment, niche, platform, title)
+
+        return metadata
+
+    def generate_template_metadata(self, moment: Dict[str, Any], niche: str = 'gaming',
+                                   platform: str = 'youtube_shorts') -> Dict[str, Any]:
+        """
+        Generate a metadata package from templates only, without calling Gemini.
+
+        Returns:
+            Dictionary with title, description, hashtags
+        """
+        title = self._template_title(
+            moment.get('quote', '').strip(),
+            moment.get('type', 'exciting'),
+            niche,
+            TITLE_LENGTH_LIMITS.get(platform, 100)
+        )
+        return self._build_metadata(moment, niche, platform, title)
+
+    def _build_metadata(self, moment: Dict[str, Any], niche: str,
+                        platform: str, title: str) -> Dict[str, Any]:
+        """Assemble the metadata package around an already chosen title."""
         description = self.generate_description(moment, niche, platform)
         hashtags = self.generate_hashtags(niche, moment.get('type', 'exciting'))
 
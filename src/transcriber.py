@@ -16,22 +16,69 @@ try:
     WHISPER_AVAILABLE = True
 except ImportError:
     WHISPER_AVAILABLE = False
+
+# faster-whisper decodes several 30s windows of a file per GPU batch
+try:
+    import ctranslate2
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+if not (WHISPER_AVAILABLE or FASTER_WHISPER_AVAILABLE):
     logging.warning("Whisper not available, transcription will be disabled")
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+COMPUTE_TYPES = ('float32', 'float16', 'int8_float16', 'int8')
+
+# CPUs have no efficient float16 kernels; use the nearest supported type
+_CPU_COMPUTE_TYPES = {'float16': 'float32', 'int8_float16': 'int8'}
+
 class Transcriber:
-    def __init__(self, model_size: str = 'base'):
+    def __init__(self, model_size: str = 'base', batch_size: int = 16,
+                 compute_type: str = 'float16', device_index: Optional[List[int]] = None):
         """
         Initialize transcriber with Whisper model.
         Model sizes: tiny, base, small, medium, large
+
+        Uses faster-whisper's batched pipeline when installed, decoding
+        batch_size 30-second windows at once; otherwise openai-whisper.
+        compute_type is one of COMPUTE_TYPES and applies on GPU; without
+        one, float16 types fall back to their CPU equivalents.
+
+        With faster-whisper, one model replica is loaded per GPU in
+        device_index (default: every visible GPU) and concurrent
+        transcribe() calls from different threads run on different GPUs.
         """
-        if not WHISPER_AVAILABLE:
-            raise ImportError("Whisper package not installed. Run: pip install openai-whisper")
+        if compute_type not in COMPUTE_TYPES:
+            raise ValueError(f"Unknown compute type: {compute_type}")
+        self.batch_size = batch_size
 
-        self.model = whisper.load_model(model_size)
-        logger.info(f"Loaded Whisper model: {model_size}")
+        if FASTER_WHISPER_AVAILABLE:
+            gpu_count = ctranslate2.get_cuda_device_count()
+            if gpu_count > 0:
+                device = 'cuda'
+                device_index = list(device_index) if device_index else list(range(gpu_count))
+            else:
+                device = 'cpu'
+                device_index = [0]
+                compute_type = _CPU_COMPUTE_TYPES.get(compute_type, compute_type)
+            model = WhisperModel(model_size, device=device, device_index=device_index,
+                                 compute_type=compute_type, num_workers=len(device_index))
+            self.model = BatchedInferencePipeline(model=model)
+            self.batched = True
+            logger.info(f"Loaded faster-whisper model: {model_size} on {device} {device_index} "
+                        f"({compute_type}, batch size {batch_size})")
+        elif WHISPER_AVAILABLE:
+            self.model = whisper.load_model(model_size)
+            self.batched = False
+            # openai-whisper only has float16 and float32; it uses float32 on CPU
+            self.fp16 = compute_type != 'float32'
+            logger.info(f"Loaded Whisper model: {model_size}")
+        else:
+            raise ImportError("Whisper package not installed. Run: pip install openai-whisper")
 
     def extract_audio(self, video_path: str, output_path: Optional[str] = None) -> Optional[str]:
         """Extract audio from video file using FFmpeg."""
@@ -61,11 +108,14 @@ class Transcriber:
     def transcribe(self, audio_path: str) -> Optional[Dict[str, Any]]:
         """Transcribe audio file using Whisper."""
         try:
-            result = self.model.transcribe(
-                audio_path,
-                word_timestamps=True,
-                fp16=False  # Use FP32 for better compatibility
-            )
+            if self.batched:
+                result = self._transcribe_batched(audio_path)
+            else:
+                result = self.model.transcribe(
+                    audio_path,
+                    word_timestamps=True,
+                    fp16=self.fp16
+                )
 
             logger.info(f"Transcribed {len(result['segments'])} segments")
             return result
@@ -74,6 +124,33 @@ class Transcriber:
             logger.error(f"Transcription failed: {e}")
             return None
 
+    def _transcribe_batched(self, audio_path: str) -> Dict[str, Any]:
+        """Transcribe with faster-whisper, returning openai-whisper's result format."""
+        segments_iter, info = self.model.transcribe(
+            audio_path,
+            batch_size=self.batch_size,
+            word_timestamps=True
+        )
+
+        segments = []
+        for i, seg in enumerate(segments_iter):
+            segments.append({
+                'id': i,
+                'start': seg.start,
+                'end': seg.end,
+                'text': seg.text,
+                'words': [
+                    {'word': w.word, 'start': w.start, 'end': w.end, 'probability': w.probability}
+                    for w in (seg.words or [])
+                ]
+            })
+
+        return {
+            'text': ''.join(seg['text'] for seg in segments),
+            'segments': segments,
+            'language': info.language
+        }
+
     def process_video(self, video_path: str, keep_audio: bool = False) -> Optional[Dict[str, Any]]:
         """
         Full pipeline: extract audio and transcribe.
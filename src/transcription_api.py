@@ -7,12 +7,19 @@ Primary transcription method to avoid bot detection issues.
 import os
 import logging
 from typing import Optional, List, Dict, Any
-import json
+import threading
 import time
 
+# orjson parses caption downloads straight from bytes; stdlib json is the fallback
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 try:
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
+    from googleapiclient.http import build_http
     YOUTUBE_API_AVAILABLE = True
 except ImportError:
     YOUTUBE_API_AVAILABLE = False
@@ -21,6 +28,9 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Only the caption track fields fetch_captions reads
+CAPTION_LIST_FIELDS = 'items(id,snippet(trackKind))'
+
 class YouTubeCaptionFetcher:
     """Fetch captions from YouTube using official API."""
     
@@ -33,8 +43,20 @@ class YouTubeCaptionFetcher:
         if not self.api_key:
             raise ValueError("YOUTUBE_API_KEY not provided")
         
-        self.youtube = build('youtube', 'v3', developerKey=self.api_key)
+        # Bundled discovery document: no discovery fetch or file cache
+        self.youtube = build('youtube', 'v3', developerKey=self.api_key,
+                             cache_discovery=False, static_discovery=True)
+        # httplib2 connections are not thread-safe, so each thread keeps
+        # its own keep-alive connection for reuse across calls
+        self._local = threading.local()
         logger.info("Initialized YouTube API client")
+
+    def _http(self):
+        """Get this thread's persistent HTTP connection."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = build_http()
+        return http
     
     def fetch_captions(self, video_id: str) -> Optional[Dict[str, Any]]:
         """Fetch captions for a video using YouTube API."""
@@ -42,8 +64,9 @@ class YouTubeCaptionFetcher:
             # Get caption tracks
             caption_list = self.youtube.captions().list(
                 part='snippet',
-                videoId=video_id
-            ).execute()
+                videoId=video_id,
+                fields=CAPTION_LIST_FIELDS
+            ).execute(http=self._http())
             
             if not caption_list.get('items'):
                 logger.info(f"No captions available for video {video_id}")
@@ -65,7 +88,7 @@ class YouTubeCaptionFetcher:
             caption = self.youtube.captions().download(
                 id=caption_id,
                 tfmt='json3'  # JSON format with timestamps
-            ).execute()
+            ).execute(http=self._http())
             
             # Parse caption data
             transcription = self._parse_caption_data(caption, video_id)
@@ -86,12 +109,14 @@ class YouTubeCaptionFetcher:
     def _parse_caption_data(self, caption_data: str, video_id: str) -> Dict[str, Any]:
         """Parse YouTube caption JSON format to match Whisper output structure."""
         try:
-            # Parse the caption data (it's a JSON string)
-            captions = json.loads(caption_data)
+            # Parse the caption data (JSON bytes or string)
+            captions = _json.loads(caption_data)
             
-            # Extract segments with timestamps
+            # Extract segments with timestamps and their words in one pass
             segments = []
             full_text = []
+            add_segment = segments.append
+            add_text = full_text.append
             
             for caption in captions.get('events', []):
                 if 'segs' in caption:
@@ -99,27 +124,17 @@ class YouTubeCaptionFetcher:
                     start_time = caption['tStartMs'] / 1000.0  # Convert ms to seconds
                     end_time = start_time + (caption.get('dDurationMs', 1000) / 1000.0)
                     
-                    segment = {
+                    # Simple word splitting - YouTube captions don't provide word-level timestamps
+                    add_segment({
                         'start': start_time,
                         'end': end_time,
                         'text': text.strip(),
-                        'words': []  # We'll populate this below
-                    }
-                    segments.append(segment)
-                    full_text.append(text)
-            
-            # Create words list for compatibility with existing code
-            words = []
-            for segment in segments:
-                # Simple word splitting - YouTube captions don't provide word-level timestamps
-                segment_words = segment['text'].split()
-                for word_text in segment_words:
-                    words.append({
-                        'word': word_text,
-                        'start': segment['start'],
-                        'end': segment['end']
+                        'words': [
+                            {'word': word_text, 'start': start_time, 'end': end_time}
+                            for word_text in text.split()
+                        ]
                     })
-                segment['words'] = words[len(words) - len(segment_words):]
+                    add_text(text)
             
             # Calculate total duration
             duration = segments[-1]['end'] if segments else 0
@@ -148,9 +163,10 @@ class YouTubeCaptionFetcher:
         """Check if captions are available for a video."""
         try:
             caption_list = self.youtube.captions().list(
-                part='snippet',
-                videoId=video_id
-            ).execute()
+                part='id',
+                videoId=video_id,
+                fields='items(id)'
+            ).execute(http=self._http())
             return bool(caption_list.get('items'))
         except HttpError as e:
             if e.resp.status == 403:
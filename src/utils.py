@@ -13,9 +13,14 @@ import hashlib
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Directories ensure_dir has already created or found in this process
+_ready_dirs = set()
+
 def ensure_dir(path: str) -> str:
-    """Ensure directory exists, create if not."""
-    os.makedirs(path, exist_ok=True)
+    """Ensure directory exists, create if not (checked once per process)."""
+    if path not in _ready_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ready_dirs.add(path)
     return path
 
 def load_json(filepath: str) -> Optional[Dict[str, Any]]:
@@ -156,6 +161,25 @@ def sanitize_filename_for_path(filename: str) -> str:
     filename = ''.join(char for char in filename if ord(char) >= 32)
     return filename
 
+def expand_clip(clip: Dict[str, Any], moments: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge a processor clip entry with the moment it was cut from.
+
+    Processor results store each moment once in results['moments'] and
+    each clip in results['clips_generated'] refers to it by index.
+
+    Args:
+        clip: Entry from results['clips_generated']
+        moments: results['moments']
+
+    Returns:
+        New dictionary with the moment fields followed by the clip's own
+    """
+    index = clip.get('moment')
+    if index is None or not 0 <= index < len(moments):
+        return dict(clip)
+    return {**moments[index], **clip}
+
 class Timer:
     """Context manager for timing operations."""
 
@@ -128,6 +128,52 @@ def test_chunk_creation(detector):
     assert len(chunks) == 4
     assert all(len(chunk) > 0 for chunk in chunks)
 
+def test_analyze_transcript_single_request(detector, mock_gemini):
+    """Test all chunks go to Gemini in one request and out-of-bounds moments are dropped."""
+    transcription = {
+        'segments': [
+            {'start': i * 10.0, 'end': (i + 1) * 10.0, 'text': f'Segment {i}'}
+            for i in range(10)
+        ]
+    }
+    mock_gemini.generate_content.return_value = Mock(text=json.dumps({
+        'moments': [
+            {'start': 5.0, 'end': 12.0, 'type': 'funny', 'quote': 'Segment 0'},
+            {'start': 82.0, 'end': 95.0, 'type': 'exciting', 'quote': 'Segment 8'},
+            {'start': 150.0, 'end': 160.0, 'type': 'exciting', 'quote': 'nope'}
+        ]
+    }))
+
+    moments = detector.analyze_transcript(transcription)
+
+    assert mock_gemini.generate_content.call_count == 1
+    # google-generativeai 0.3.1 / gemini-pro has no JSON mode; send the prompt only
+    assert mock_gemini.generate_content.call_args.kwargs == {}
+    assert sorted(m['start'] for m in moments) == [5.0, 82.0]
+
+def test_detect_moments_partial_failure(detector, mock_gemini):
+    """Test a failed Gemini batch marks the results incomplete."""
+    from analyzer import CHUNKS_PER_REQUEST
+
+    # Two requests' worth of 30-second chunks
+    transcription = {
+        'segments': [
+            {'start': i * 40.0, 'end': i * 40.0 + 10.0, 'text': f'Segment {i}'}
+            for i in range(CHUNKS_PER_REQUEST + 1)
+        ]
+    }
+    mock_gemini.generate_content.side_effect = [
+        Mock(text=json.dumps({
+            'moments': [{'start': 0.0, 'end': 8.0, 'type': 'funny', 'quote': 'Segment 0'}]
+        })),
+        Exception('quota exceeded')
+    ]
+    moments, complete = detector.detect_moments(transcription)
+
+    assert mock_gemini.generate_content.call_count == 2
+    assert [m['start'] for m in moments] == [0.0]
+    assert complete is False
+
 def test_empty_transcription(detector, sample_transcription):
     """Test handling empty transcription."""
     empty_transcription = {
@@ -137,3 +183,22 @@ def test_empty_transcription(detector, sample_transcription):
     moments = detector.analyze_transcript(empty_transcription)
 
     assert moments == []
+
+def test_parse_moments_response():
+    """Test parsing Gemini moments JSON, dropping malformed entries."""
+    from analyzer import _parse_moments_response
+
+    moments = _parse_moments_response(json.dumps({
+        'moments': [
+            {'start': 5, 'end': 10.5, 'type': 'funny', 'description': 'Test', 'quote': 'lol'},
+            {'end': 20.0, 'type': 'exciting'},
+            {'start': 'soon', 'end': 30.0}
+        ]
+    }))
+
+    assert moments == [
+        {'start': 5.0, 'end': 10.5, 'type': 'funny', 'description': 'Test', 'quote': 'lol'}
+    ]
+
+    with pytest.raises(json.JSONDecodeError):
+        _parse_moments_response('not json')
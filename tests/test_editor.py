@@ -98,3 +98,117 @@ def test_batch_process_moments(editor, mock_subprocess):
         )
 
     assert len(results) == 2
+
+def test_platform_settings_crop_filter():
+    """Test crop filter derivation from platform specs."""
+    from editor import PLATFORM_SETTINGS, _crop_filter
+
+    spec = PLATFORM_SETTINGS['youtube_shorts']
+    assert spec.width == 1080
+    assert spec.height == 1920
+
+    crop_filter = _crop_filter(1920, 1080, spec)
+    assert crop_filter == "crop=607:1080:656:0,scale=1080:1920"
+
+def test_clips_within_limits():
+    """Test moments are only paired with platforms they fit."""
+    from editor import clips_within_limits
+
+    short = {'start': 0.0, 'end': 30.0}
+    medium = {'start': 0.0, 'end': 75.0}
+    platforms = ['youtube_shorts', 'tiktok', 'instagram_reels']
+
+    pairs = clips_within_limits([short, medium], platforms)
+    assert [(m['end'], p) for m, p in pairs] == [
+        (30.0, 'youtube_shorts'), (30.0, 'tiktok'), (30.0, 'instagram_reels'),
+        (75.0, 'tiktok'), (75.0, 'instagram_reels')
+    ]
+
+def test_clips_within_limits_many_moments():
+    """Test the vectorized filter matches the per-moment rule."""
+    from editor import PLATFORM_SETTINGS, clips_within_limits
+
+    moments = [{'start': float(i), 'end': float(i) + (i * 7) % 120} for i in range(50)]
+    platforms = ['youtube_shorts', 'tiktok', 'instagram_reels']
+
+    expected = [
+        (m, p) for m in moments for p in platforms
+        if m['end'] - m['start'] <= PLATFORM_SETTINGS[p].max_duration
+    ]
+    assert clips_within_limits(moments, platforms) == expected
+
+def test_process_clip_for_all_platforms(tmp_path, mock_subprocess):
+    """Test encoding one moment for several platforms in one ffmpeg run."""
+    editor = VideoEditor(output_dir=str(tmp_path))
+
+    def run(cmd, **kwargs):
+        if cmd[0] == 'ffprobe':
+            return Mock(stdout='{"streams": [{"width": 1920, "height": 1080}]}')
+        for arg in cmd:
+            if arg.endswith('.part.mp4'):
+                open(arg, 'wb').close()
+
+    mock_subprocess.run.side_effect = run
+
+    result = editor.process_clip_for_all_platforms(
+        'test.mp4', 10.0, 20.0, ['youtube_shorts', 'tiktok']
+    )
+
+    assert set(result) == {'youtube_shorts', 'tiktok'}
+    assert all(os.path.exists(path) for path in result.values())
+    assert mock_subprocess.run.call_count == 2
+
+    ffmpeg_cmd = mock_subprocess.run.call_args_list[1][0][0]
+    assert ffmpeg_cmd[ffmpeg_cmd.index('-filter_complex') + 1].startswith('[0:v]split=2')
+
+    # A rerun reuses the encoded clips and only encodes the new platform
+    result = editor.process_clip_for_all_platforms(
+        'test.mp4', 10.0, 20.0, ['youtube_shorts', 'tiktok', 'instagram_reels']
+    )
+
+    assert all(result.values())
+    ffmpeg_cmd = mock_subprocess.run.call_args_list[-1][0][0]
+    assert ffmpeg_cmd[ffmpeg_cmd.index('-filter_complex') + 1].startswith('[0:v]split=1')
+
+def test_process_clip_stream_copy(tmp_path, mock_subprocess):
+    """Test sources already matching a platform are stream-copied, not re-encoded."""
+    editor = VideoEditor(output_dir=str(tmp_path))
+    mock_subprocess.run.side_effect = [
+        Mock(stdout=json.dumps({'streams': [{
+            'width': 1080, 'height': 1920, 'codec_name': 'h264', 'avg_frame_rate': '30/1'
+        }]})),
+        None
+    ]
+
+    with patch('editor.os.replace'):
+        result = editor.process_clip_for_all_platforms('test.mp4', 10.0, 20.0, ['tiktok'])
+
+    assert result['tiktok']
+    ffmpeg_cmd = mock_subprocess.run.call_args_list[1][0][0]
+    assert '-filter_complex' not in ffmpeg_cmd
+    assert ffmpeg_cmd[ffmpeg_cmd.index('-c:v') + 1] == 'copy'
+    assert ffmpeg_cmd[ffmpeg_cmd.index('-c:a') + 1] == 'aac'
+
+def test_process_clip_failure_removes_partial_clips(tmp_path, mock_subprocess):
+    """Test a failed ffmpeg run leaves no temporary outputs behind."""
+    import subprocess
+
+    editor = VideoEditor(output_dir=str(tmp_path))
+    mock_subprocess.CalledProcessError = subprocess.CalledProcessError
+
+    def run(cmd, **kwargs):
+        if cmd[0] == 'ffprobe':
+            return Mock(stdout='{"streams": [{"width": 1920, "height": 1080}]}')
+        for arg in cmd:
+            if arg.endswith('.part.mp4'):
+                open(arg, 'wb').close()
+        raise subprocess.CalledProcessError(1, cmd, stderr=b'encode failed')
+
+    mock_subprocess.run.side_effect = run
+
+    result = editor.process_clip_for_all_platforms(
+        'test.mp4', 10.0, 20.0, ['youtube_shorts', 'tiktok']
+    )
+
+    assert result == {'youtube_shorts': None, 'tiktok': None}
+    assert list(tmp_path.iterdir()) == []
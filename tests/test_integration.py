@@ -59,7 +59,7 @@ def test_full_pipeline(mock_dependencies):
 
         # Mock detector to return moments
         processor.detector = Mock()
-        processor.detector.analyze_transcript = Mock(return_value=[
+        processor.detector.detect_moments = Mock(return_value=([
             {
                 'start': 10.0,
                 'end': 15.0,
@@ -68,7 +68,7 @@ def test_full_pipeline(mock_dependencies):
                 'quote': 'This is an exciting moment',
                 'virality_score': 85
             }
-        ])
+        ], True))
         processor.detector.select_best_moments = Mock(return_value=[
             {
                 'start': 10.0,
@@ -82,9 +82,13 @@ def test_full_pipeline(mock_dependencies):
 
         # Mock editor
         processor.editor.process_clip_for_platform = Mock(return_value='test_clip.mp4')
+        processor.editor.process_clip_for_all_platforms = Mock(
+            side_effect=lambda path, start, end, platforms: dict.fromkeys(platforms, 'test_clip.mp4')
+        )
 
         # Mock database
         processor.db.add_clip = Mock(return_value=1)
+        processor.db.add_clips_bulk = Mock(return_value=[1, 2, 3])
         processor.db.mark_video_processed = Mock(return_value=True)
 
         # Process video
@@ -95,7 +99,7 @@ def test_full_pipeline(mock_dependencies):
         assert len(results['clips_generated']) > 0
         assert processor.downloader.download.called
         assert processor.transcriber.process_video.called
-        assert processor.detector.analyze_transcript.called
+        assert processor.detector.detect_moments.called
 
     finally:
         # Cleanup
@@ -187,6 +191,13 @@ def test_database_operations():
         clip_id = db.add_clip(clip_data)
         assert clip_id > 0
 
+        clip_ids = db.add_clips_bulk([
+            dict(clip_data, platform=platform)
+            for platform in ('tiktok', 'instagram_reels')
+        ])
+        assert len(clip_ids) == 2
+        assert clip_id < clip_ids[0] < clip_ids[1]
+
         # Test state operations
         db.set_state('test_key', 'test_value')
         value = db.get_state('test_key')
@@ -195,6 +206,134 @@ def test_database_operations():
     finally:
         os.remove(db_path)
 
+def test_transcript_and_moment_cache():
+    """Test stored transcripts and moments are keyed by model and version."""
+    from database import Database
+
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+
+    try:
+        db = Database(db_path)
+        transcript = {'text': 'hello', 'segments': [{'start': 0.0, 'end': 1.5, 'text': 'hello'}]}
+
+        assert db.get_transcript('vid1', 'base') is None
+        assert db.save_transcript('vid1', transcript, 'base')
+        assert db.get_transcript('vid1', 'base') == transcript
+        assert db.get_transcript('vid1', 'large') is None
+
+        # Caption transcripts are not tied to a Whisper model
+        assert db.save_transcript('vid2', transcript)
+        assert db.get_transcript('vid2', 'large') == transcript
+
+        moments = [{'start': 1.0, 'end': 9.0, 'virality_score': 88.0}]
+        assert db.save_moments('vid1', 'v1', moments)
+        assert db.get_moments('vid1', 'v1') == moments
+        assert db.get_moments('vid1', 'v2') is None
+
+    finally:
+        os.remove(db_path)
+
+def test_claim_discovered_batch():
+    """Test claiming discovered videos marks them as analyzing."""
+    from database import Database
+
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+
+    try:
+        db = Database(db_path)
+        for i in range(3):
+            db.add_video({'youtube_id': f'vid{i}', 'title': f'Video {i}', 'niche': 'gaming'})
+
+        # The listing API still returns plain dicts
+        discovered = db.get_discovered_videos(limit=10)
+        assert len(discovered) == 3
+        assert all(isinstance(v, dict) and v['status'] == 'discovered' for v in discovered)
+
+        claimed = db.claim_discovered_batch(limit=2)
+        assert len(claimed) == 2
+        assert all(v.status == 'analyzing' for v in claimed)
+
+        # Already-claimed videos are not handed out again
+        remaining = db.claim_discovered_batch(limit=5)
+        assert len(remaining) == 1
+        assert remaining[0].youtube_id not in {v.youtube_id for v in claimed}
+
+    finally:
+        os.remove(db_path)
+
+def test_claim_top_analyzed_batch():
+    """Test claiming top analyzed videos marks them as processing."""
+    from database import Database
+
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+
+    try:
+        db = Database(db_path)
+        for i, score in enumerate([60.0, 90.0, 80.0, 75.0]):
+            db.add_video({'youtube_id': f'vid{i}', 'title': f'Video {i}', 'niche': 'gaming'})
+            db.update_video_status(f'vid{i}', 'analyzed', score)
+
+        claimed = db.claim_top_analyzed_batch(limit=2, threshold=70.0)
+        assert [v.youtube_id for v in claimed] == ['vid1', 'vid2']
+        assert all(v.status == 'processing' for v in claimed)
+
+        # Only the remaining video above threshold is left to claim
+        remaining = db.claim_top_analyzed_batch(limit=5, threshold=70.0)
+        assert [v.youtube_id for v in remaining] == ['vid3']
+
+    finally:
+        os.remove(db_path)
+
+def test_status_writer_applies_updates_in_order():
+    """Test the background status writer keeps per-video update order."""
+    from database import Database, StatusWriter
+
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+
+    try:
+        db = Database(db_path)
+        db.add_video({'youtube_id': 'vid0', 'title': 'Video 0', 'niche': 'gaming'})
+        db.add_video({'youtube_id': 'vid1', 'title': 'Video 1', 'niche': 'gaming'})
+
+        with StatusWriter(db, batch_size=10, flush_interval=0.05) as writer:
+            writer.enqueue('vid0', 'analyzed', 88.0)
+            writer.enqueue('vid1', 'failed')
+            writer.enqueue('vid0', 'processing')
+            writer.enqueue('vid0', 'published')
+
+        video = db.get_video('vid0')
+        assert video['status'] == 'published'
+        assert video['virality_score'] == 88.0
+        assert db.get_video('vid1')['status'] == 'failed'
+
+    finally:
+        os.remove(db_path)
+
+def test_database_session_reuses_connection():
+    """Test calls inside a session share one connection."""
+    from database import Database
+
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+
+    try:
+        db = Database(db_path)
+
+        with db.session():
+            assert db._get_connection() is db._get_connection()
+            db.add_video({'youtube_id': 'vid0', 'title': 'Video 0', 'niche': 'gaming'})
+            assert db.get_video('vid0')['title'] == 'Video 0'
+            assert db.count_discovered() == 1
+
+        assert db.get_video('vid0') is not None
+
+    finally:
+        os.remove(db_path)
+
 def test_qa_workflow():
     """Test quality assurance workflow."""
     from quality_assurance import QualityAssurance
@@ -226,6 +365,17 @@ def test_qa_workflow():
     report = qa.check_clip(bad_clip)
     assert report['passed'] == False
     assert len(report['issues']) > 0
+    # A critical duration issue skips the text scans in strict mode,
+    # and skipped checks do not count towards the overall score
+    assert report['skipped'] == ['content', 'profanity', 'copyright']
+    assert 'content' not in report['scores']
+    assert report['overall_score'] == report['scores']['duration']
+    assert qa._text_checks.cache_info().currsize == 1
+
+    # The same quote on another platform reuses the text checks but not duration
+    report = qa.check_clip(dict(good_clip, platform='tiktok', end=85.0))
+    assert report['passed'] == True
+    assert qa._text_checks.cache_info().hits == 1
 
 def test_seo_generation():
     """Test SEO metadata generation."""
@@ -257,6 +407,98 @@ def test_seo_generation():
     metadata_insta = seo.generate_metadata(moment, 'Fortnite', 'instagram_reels')
     assert metadata_insta['platform'] == 'instagram_reels'
 
+def test_seo_generation_batch():
+    """Test batched SEO metadata generation."""
+    from seo_generator import SEOGenerator
+
+    seo = SEOGenerator()
+
+    moment = {
+        'start': 10.0,
+        'end': 15.0,
+        'type': 'funny',
+        'quote': 'I can\'t believe that happened!'
+    }
+    platforms = ['youtube_shorts', 'tiktok', 'instagram_reels']
+
+    metadata = seo.generate_metadata_batch([(moment, p) for p in platforms], 'Fortnite')
+
+    assert sorted(metadata) == [0, 1, 2]
+    for i, platform in enumerate(platforms):
+        assert metadata[i]['platform'] == platform
+        assert len(metadata[i]['title']) > 0
+        assert len(metadata[i]['hashtags']) > 0
+
+    # Template-only fallback used when the batch is unavailable
+    fallback = seo.generate_template_metadata(moment, 'Fortnite', 'tiktok')
+    assert fallback['platform'] == 'tiktok'
+    assert len(fallback['title']) > 0
+    assert len(fallback['hashtags']) > 0
+
+    # AI titles: plain prompt, fenced JSON text response
+    seo.use_ai = True
+    seo.model = Mock()
+    seo.model.generate_content.return_value = Mock(
+        text='```json\n[{"i": 1, "title": "This Fortnite moment is unreal"}]\n```'
+    )
+    titles = seo._generate_ai_titles_batch([(moment, p) for p in platforms], 'Fortnite')
+
+    assert titles == {1: 'This Fortnite moment is unreal'}
+    assert seo.model.generate_content.call_args.kwargs == {}
+
+def test_resolve_metadata_batch_falls_back_on_failure():
+    """Test a failed batch metadata request yields an empty batch."""
+    from concurrent.futures import Future
+    from processor import _resolve_metadata_batch
+
+    done = Future()
+    done.set_result({0: {'title': 'Clip'}})
+    assert _resolve_metadata_batch(done) == {0: {'title': 'Clip'}}
+
+    failed = Future()
+    failed.set_exception(RuntimeError('quota exceeded'))
+    assert _resolve_metadata_batch(failed) == {}
+
+def test_worker_round_trip():
+    """Test worker mode answers every job line and keeps child output off stdout."""
+    import subprocess
+
+    src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+    worker = f"""
+import subprocess, sys
+sys.path.insert(0, {src_dir!r})
+from unittest.mock import patch
+import processor
+
+def process_video(self, video_id, niche=None, phase='creation'):
+    # Children inherit fd 1, as yt-dlp and ffmpeg do
+    subprocess.run(['echo', 'child output'], check=True)
+    print('stray print')
+    return {{'video_id': video_id, 'phase': phase, 'success': True}}
+
+with patch.object(processor.VideoProcessor, '__init__', lambda self, config=None: None), \\
+     patch.object(processor.VideoProcessor, 'warm_up', lambda self: None), \\
+     patch.object(processor.VideoProcessor, 'process_video', process_video):
+    processor.run_worker({{}})
+"""
+    jobs = b'\n'.join([
+        b'{"video_id": "abc", "niche": "Fortnite", "phase": "analysis"}',
+        b'not json',
+        b'{"video_id": "def", "phase": "publish"}'
+    ]) + b'\n'
+
+    proc = subprocess.run([sys.executable, '-c', worker], input=jobs,
+                          capture_output=True, timeout=60)
+
+    assert proc.returncode == 0, proc.stderr.decode()
+    lines = [json.loads(line) for line in proc.stdout.splitlines()]
+    assert len(lines) == 3
+    assert lines[0] == {'video_id': 'abc', 'phase': 'analysis', 'success': True}
+    assert lines[1]['success'] is False and 'Invalid job' in lines[1]['errors'][0]
+    assert lines[2]['success'] is False and 'unknown phase' in lines[2]['errors'][0]
+    assert b'child output' in proc.stderr
+    assert b'stray print' in proc.stderr
+
 def test_caption_generation():
     """Test caption generation."""
     from caption_generator import CaptionGenerator
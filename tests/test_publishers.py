@@ -35,9 +35,9 @@ def youtube_publisher(mock_youtube_api):
 
 def test_upload_clip(youtube_publisher, mock_youtube_api):
     """Test uploading clip to YouTube."""
-    mock_youtube_api.videos().insert().execute.return_value = {
+    mock_youtube_api.videos().insert().next_chunk.return_value = (None, {
         'id': 'yt_test123'
-    }
+    })
 
     video_id = youtube_publisher.upload_clip(
         'test.mp4',
@@ -51,9 +51,9 @@ def test_upload_clip(youtube_publisher, mock_youtube_api):
 
 def test_publish_clip(youtube_publisher, mock_youtube_api):
     """Test publishing clip with metadata."""
-    mock_youtube_api.videos().insert().execute.return_value = {
+    mock_youtube_api.videos().insert().next_chunk.return_value = (None, {
         'id': 'yt_test123'
-    }
+    })
 
     clip_data = {
         'clip_path': 'test.mp4',
@@ -88,6 +88,24 @@ def test_get_video_stats(youtube_publisher, mock_youtube_api):
     assert stats['likes'] == 100
     assert stats['comments'] == 10
 
+def test_get_video_stats_batch(youtube_publisher, mock_youtube_api):
+    """Test fetching statistics for many videos in chunked list calls."""
+    mock_youtube_api.videos().list().execute.return_value = {
+        'items': [{
+            'id': 'yt_a',
+            'statistics': {'viewCount': '5', 'likeCount': '2', 'commentCount': '1'}
+        }]
+    }
+    mock_youtube_api.videos().list.reset_mock()
+
+    video_ids = [f'yt_{i}' for i in range(60)] + ['yt_0']
+    stats = youtube_publisher.get_video_stats_batch(video_ids)
+
+    assert stats == {'yt_a': {'views': 5, 'likes': 2, 'comments': 1}}
+    # 60 unique IDs need two list calls of at most 50 IDs each
+    calls = mock_youtube_api.videos().list.call_args_list
+    assert [len(call.kwargs['id'].split(',')) for call in calls] == [50, 10]
+
 # TikTok Publisher Tests
 
 @pytest.fixture